@@ -3,6 +3,7 @@ import sys
 import asyncio
 import logging
 from src.utils.logging import setup_logger
+from src.utils.event_loop import install_uvloop
 
 # Add project root to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -15,15 +16,16 @@ async def main():
         from src.main import test_consensus_system
         await test_consensus_system()
     except Exception as e:
-        logger.error(f"Error running consensus system: {str(e)}", exc_info=True)
+        logger.error("Error running consensus system: %s", e, exc_info=True)
         sys.exit(1)
 
 if __name__ == "__main__":
+    install_uvloop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Process interrupted by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Fatal error: {str(e)}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1) 
\ No newline at end of file
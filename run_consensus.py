@@ -1,22 +1,133 @@
 import asyncio
 import logging
+import pandas as pd
 import streamlit as st
 from src.config.config_loader import ConfigLoader
 from src.orchestration.board_orchestrator import BoardOrchestrator
 from src.visualization.consensus_visualizer import ConsensusVisualizer
 from src.utils.logging import setup_logger
+from src.utils.event_loop import install_uvloop
 
 # Set up logging
 logger = setup_logger("consensus_system", logging.DEBUG)
 
+# Fragments (Streamlit >= 1.37) rerun on their own instead of the whole script
+fragment = getattr(st, 'fragment', lambda func: func)
+
+@st.cache_resource
+def get_ai_config():
+    """Load the AI configuration once per server process"""
+    return ConfigLoader().get_ai_config()
+
+@st.cache_resource
+def get_visualizer() -> ConsensusVisualizer:
+    """Share one visualizer across reruns and sessions"""
+    return ConsensusVisualizer(get_ai_config())
+
+@st.cache_data(show_spinner=False)
+def build_agreement_network(_visualizer: ConsensusVisualizer, clusters):
+    """Build the agreement network figure once per set of clusters"""
+    return _visualizer.create_agreement_network(clusters)
+
+@st.cache_data(show_spinner=False)
+def build_opinion_distribution(_visualizer: ConsensusVisualizer, voting_data):
+    """Build the opinion distribution figure once per voting result"""
+    return _visualizer.create_opinion_distribution(voting_data)
+
+@fragment
+def render_results(result, visualizer: ConsensusVisualizer):
+    """Render the discussion results section"""
+    logger.info("Displaying discussion results...")
+    try:
+        st.header("Discussion Results")
+
+        # Overview metrics
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Consensus Score", f"{result['consensus_score']:.2f}")
+        with col2:
+            st.metric("Number of Clusters", len(result['opinion_clusters']))
+        with col3:
+            st.metric("Key Disagreements", len(result['key_disagreements']))
+
+        # Agreement Network
+        logger.debug("Creating agreement network visualization...")
+        st.subheader("Agreement Network")
+        network_fig = build_agreement_network(visualizer, result['opinion_clusters'])
+        st.plotly_chart(network_fig, use_container_width=True)
+
+        # Opinion Distribution
+        logger.debug("Creating opinion distribution visualization...")
+        st.subheader("Opinion Distribution")
+        opinion_fig = build_opinion_distribution(visualizer, result['weighted_voting'])
+        st.plotly_chart(opinion_fig, use_container_width=True)
+
+        # Key Disagreements
+        logger.debug("Displaying key disagreements...")
+        st.subheader("Key Disagreements")
+        disagreements = pd.DataFrame(
+            [
+                {
+                    'Aspect': disagreement['aspect'],
+                    'Severity': disagreement['severity'],
+                    'Positions': "; ".join(
+                        f"{agent}: {position}"
+                        for agent, position in disagreement['positions'].items()
+                    )
+                }
+                for disagreement in result['key_disagreements']
+            ],
+            columns=['Aspect', 'Severity', 'Positions']
+        )
+        st.dataframe(
+            disagreements,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                'Severity': st.column_config.NumberColumn(format="%.2f")
+            }
+        )
+
+        # Suggested Compromises
+        logger.debug("Displaying suggested compromises...")
+        st.subheader("Suggested Compromises")
+        compromises = pd.DataFrame(
+            [
+                {
+                    'Compromise': suggestion['description'],
+                    'Supporting Agents': ', '.join(suggestion['supporting_agents']),
+                    'Expected Impact': suggestion['expected_impact'],
+                    'Acceptance Likelihood': suggestion['acceptance_likelihood']
+                }
+                for suggestion in result['suggested_compromises']
+            ],
+            columns=['Compromise', 'Supporting Agents', 'Expected Impact', 'Acceptance Likelihood']
+        )
+        st.dataframe(
+            compromises,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                'Acceptance Likelihood': st.column_config.ProgressColumn(
+                    min_value=0.0, max_value=1.0, format="%.2f"
+                )
+            }
+        )
+
+        logger.info("Results displayed successfully")
+        
+    except Exception as e:
+        logger.error("Error displaying results: %s", e, exc_info=True)
+        st.error("An error occurred while displaying the results.")
+
 async def run_consensus_system():
     try:
         logger.info("Starting consensus system...")
         
-        # Initialize system
-        config = ConfigLoader().get_ai_config()
+        # Initialize system. The orchestrator is rebuilt per run: its AI clients
+        # hold connections bound to the event loop that asyncio.run creates.
         orchestrator = BoardOrchestrator()
-        visualizer = ConsensusVisualizer(config)
+        visualizer = get_visualizer()
 
         # Create test proposal
         proposal = {
@@ -72,59 +183,12 @@ async def run_consensus_system():
             st.write(proposal['description'])
 
         # Display results
-        logger.info("Displaying discussion results...")
-        try:
-            st.header("Discussion Results")
-
-            # Overview metrics
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Consensus Score", f"{result['consensus_score']:.2f}")
-            with col2:
-                st.metric("Number of Clusters", len(result['opinion_clusters']))
-            with col3:
-                st.metric("Key Disagreements", len(result['key_disagreements']))
-
-            # Agreement Network
-            logger.debug("Creating agreement network visualization...")
-            st.subheader("Agreement Network")
-            network_fig = visualizer.create_agreement_network(result['opinion_clusters'])
-            st.plotly_chart(network_fig, use_container_width=True)
-
-            # Opinion Distribution
-            logger.debug("Creating opinion distribution visualization...")
-            st.subheader("Opinion Distribution")
-            opinion_fig = visualizer.create_opinion_distribution(result['weighted_voting'])
-            st.plotly_chart(opinion_fig, use_container_width=True)
-
-            # Key Disagreements
-            logger.debug("Displaying key disagreements...")
-            st.subheader("Key Disagreements")
-            for disagreement in result['key_disagreements']:
-                with st.expander(f"Disagreement: {disagreement['aspect']}"):
-                    st.write(f"**Severity:** {disagreement['severity']:.2f}")
-                    st.write("**Positions:**")
-                    for agent, position in disagreement['positions'].items():
-                        st.write(f"- {agent}: {position}")
-
-            # Suggested Compromises
-            logger.debug("Displaying suggested compromises...")
-            st.subheader("Suggested Compromises")
-            for suggestion in result['suggested_compromises']:
-                with st.expander(f"Compromise: {suggestion['description']}"):
-                    st.write(f"**Supporting Agents:** {', '.join(suggestion['supporting_agents'])}")
-                    st.write(f"**Expected Impact:** {suggestion['expected_impact']}")
-                    st.progress(suggestion['acceptance_likelihood'])
-
-            logger.info("Results displayed successfully")
-            
-        except Exception as e:
-            logger.error(f"Error displaying results: {str(e)}", exc_info=True)
-            st.error("An error occurred while displaying the results.")
+        render_results(result, visualizer)
 
     except Exception as e:
-        logger.error(f"System error: {str(e)}", exc_info=True)
+        logger.error("System error: %s", e, exc_info=True)
         st.error(f"An error occurred: {str(e)}")
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(run_consensus_system()) 
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""Academic affairs scores for program rigor, research potential, teaching load, space use, integration and tracking"""
+
+
+def program_rigor_score(research_area_count: int, faculty: int) -> float:
+    """Average of research depth and faculty resource scores"""
+    research_score = min(research_area_count * 0.2, 1.0)
+    faculty_score = min(faculty * 0.1, 1.0)
+    return (research_score + faculty_score) / 2
+
+
+def research_potential_score(research_area_count: int, funding_source_count: int) -> float:
+    """Average of research breadth and funding diversity"""
+    research_breadth = min(research_area_count * 0.25, 1.0)
+    funding_diversity = funding_source_count * 0.3
+    return (research_breadth + funding_diversity) / 2
+
+
+def teaching_load_score(faculty: int, graduate_students: int) -> float:
+    """Score the student-faculty ratio (lower is better)"""
+    # Without faculty the load cannot be carried at all
+    if faculty <= 0:
+        return 0.0
+    ratio = graduate_students / faculty
+    return max(1.0 - (ratio / 20), 0.0)
+
+
+def resource_utilization_score(total_space: float, headcount: int) -> float:
+    """Score space per person, assuming 200 sq ft per person is ideal (lower is better)"""
+    space_per_person = total_space / headcount
+    return max(1.0 - (space_per_person / 200), 0.0)
+
+
+def integration_feasibility_score(timeline_years: float) -> float:
+    """Score the implementation timeline (shorter is better, but not too short)"""
+    if timeline_years < 1:
+        return 0.5  # Too rushed
+    elif timeline_years <= 3:
+        return 0.9  # Ideal timeline
+    else:
+        return max(1.0 - ((timeline_years - 3) * 0.1), 0.6)  # Penalty for longer timelines
+
+
+def tracking_complexity_score(timeline_years: float, stakeholder_count: int,
+                              research_area_count: int, funding_source_count: int) -> float:
+    """Weighted complexity of tracking a proposal, each factor capped at its saturation point"""
+    return (
+        0.3 * min(timeline_years / 5, 1.0) +
+        0.3 * min(stakeholder_count / 10, 1.0) +
+        0.2 * min(research_area_count / 5, 1.0) +
+        0.2 * min(funding_source_count / 3, 1.0)
+    )
@@ -1,18 +1,114 @@
-from typing import Dict, List, Any
+from typing import Any, Awaitable, Callable, Dict, List
 from abc import ABC, abstractmethod
-from src.ai.claude_integration import ClaudeAI
+from collections import OrderedDict
+from src.ai.claude_integration import TRANSIENT_ERRORS, ClaudeAI
 from src.utils.logging import setup_logger
+from src.utils.prompt_template import compile_template
+import copy
+import hashlib
+import json
+import re
+import textwrap
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Section labels the AI uses in its responses, mapped to the section they introduce
+SECTION_ALIASES = {
+    'concern': 'concerns', 'concerns': 'concerns',
+    'risk': 'concerns', 'risks': 'concerns',
+    'challenge': 'concerns', 'challenges': 'concerns',
+    'improvement': 'improvements', 'improvements': 'improvements',
+    'suggestion': 'suggestions', 'suggestions': 'suggestions',
+    'recommendation': 'suggestions', 'recommendations': 'suggestions',
+    'modification': 'suggestions', 'modifications': 'suggestions',
+    'assessment': 'assessment', 'conclusion': 'assessment', 'summary': 'assessment',
+    'rationale': 'rationale', 'reasoning': 'rationale', 'because': 'rationale',
+    'vote': 'vote'
+}
+
+# A label followed by a colon, with its body running to the next blank line
+SECTION_RE = re.compile(
+    r'\b(' + '|'.join(sorted(SECTION_ALIASES, key=len, reverse=True)) + r')\s*:\s*(.*?)(?:\n\s*\n|\Z)',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Words that express a vote, mapped to the vote they cast
+VOTE_MAP = {
+    'support': 'support',
+    'approve': 'support',
+    'yes': 'support',
+    'oppose': 'oppose',
+    'reject': 'oppose',
+    'no': 'oppose',
+    'abstain': 'abstain'
+}
+
+VOTE_RE = re.compile(r'\b(' + '|'.join(VOTE_MAP) + r')\b', re.IGNORECASE)
+
+# Fields each kind of parsed response exposes
+EVALUATION_FIELDS = ('key_points', 'concerns', 'improvements', 'assessment')
+VOTE_FIELDS = ('vote', 'rationale', 'concerns', 'suggestions')
+
+# Sections a voting response must finish before it can be parsed
+VOTE_SECTIONS = frozenset(('rationale', 'concerns', 'suggestions'))
+
+# A bulleted or numbered line, capturing the item text
+BULLET_RE = re.compile(r'^[ \t]*(?:[-•*]|\d+\.)[ \t]+(.+)$', re.MULTILINE)
+
+# Generic prompts, dedented once so indentation is not sent as prompt text.
+# They ask for JSON; prose answers still go through the section parsers.
+EVALUATION_PROMPT = textwrap.dedent("""\
+    As the {role}, evaluate this proposal:
+
+    {description}
+
+    Consider alignment with your priorities, potential impacts, concerns and risks, and opportunities and benefits.
+    Respond with a single JSON object of the form
+    {{"key_points": [...], "concerns": [...], "improvements": [...], "assessment": "..."}}
+    """)
+
+FEEDBACK_PROMPT = textwrap.dedent("""\
+    As the {role}, give constructive, specific, solution-oriented feedback on the current discussion:
+    areas of agreement, points of concern, suggested modifications and potential compromises.
+    """)
+
+VOTING_PROMPT = textwrap.dedent("""\
+    As the {role}, vote on this proposal:
+
+    {description}
+
+    Weigh your priorities, earlier discussion points, potential impacts and implementation feasibility.
+    Respond with a single JSON object of the form
+    {{"vote": "support|oppose|abstain", "rationale": "...", "concerns": [...], "suggestions": [...]}}
+    """)
+
 class BoardAgent(ABC):
     """Base class for all board member agents"""
     
-    def __init__(self, role: str, priorities: List[str], config: Dict[str, Any]):
+    __slots__ = (
+        'role', 'priorities', 'voting_history', 'ai', 'config',
+        '_response_cache', '_evaluation_cache', 'logger'
+    )
+    
+    # Most recent AI responses kept per agent for repeated prompts
+    RESPONSE_CACHE_SIZE = 128
+    
+    # Most recent evaluations kept per agent for proposals seen again
+    EVALUATION_CACHE_SIZE = 64
+    
+    def __init__(self, role: str, priorities: List[str], config: Dict[str, Any], ai: ClaudeAI = None):
         self.role = role
         self.priorities = priorities
         self.voting_history = []
-        self.ai = ClaudeAI(config)
+        # Agents given a shared client reuse its connection pool instead of opening their own
+        self.ai = ai if ai is not None else ClaudeAI(config)
         self.config = config
+        self._response_cache = OrderedDict()
+        self._evaluation_cache = OrderedDict()
         self.logger = setup_logger(f"{__name__}.{self.__class__.__name__}")
     
     @abstractmethod
@@ -30,73 +126,26 @@ class BoardAgent(ABC):
         """Cast a vote with rationale"""
         pass
     
+    def _render_prompt(self, name: str, fields: Dict[str, Any]) -> str:
+        """Render one of the agent's prompt templates with the given fields"""
+        return compile_template(self.prompts[name])(fields)
+    
     def _construct_evaluation_prompt(self, proposal: Dict[str, Any]) -> str:
         """Construct prompt for proposal evaluation"""
-        return f"""
-        As the {self.role}, evaluate the following proposal:
-        
-        {proposal['description']}
-        
-        Consider these aspects from your role's perspective:
-        1. Alignment with your priorities
-        2. Potential impacts
-        3. Concerns and risks
-        4. Opportunities and benefits
-        
-        Provide a structured evaluation including:
-        - Key points of analysis
-        - Specific concerns
-        - Potential improvements
-        - Overall assessment
-        """
+        return EVALUATION_PROMPT.format(role=self.role, description=proposal['description'])
     
     def _construct_feedback_prompt(self, context: Dict[str, Any]) -> str:
         """Construct prompt for feedback generation"""
-        return f"""
-        Based on the current discussion state and your role as {self.role},
-        provide constructive feedback on:
-        
-        1. Areas of agreement
-        2. Points of concern
-        3. Suggested modifications
-        4. Potential compromises
-        
-        Frame your feedback to be:
-        - Constructive
-        - Specific
-        - Solution-oriented
-        - Role-aligned
-        """
+        return FEEDBACK_PROMPT.format(role=self.role)
     
     def _construct_voting_prompt(self, proposal: Dict[str, Any]) -> str:
         """Construct prompt for voting decision"""
-        return f"""
-        As the {self.role}, cast your vote on the current proposal:
-        
-        {proposal['description']}
-        
-        Provide:
-        1. Your vote (support/oppose/abstain)
-        2. Detailed rationale
-        3. Key concerns (if any)
-        4. Suggested modifications (if any)
-        
-        Base your decision on:
-        - Your role's priorities
-        - Previous discussion points
-        - Potential impacts
-        - Implementation feasibility
-        """ 
+        return VOTING_PROMPT.format(role=self.role, description=proposal['description'])
     
     def _parse_evaluation_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
         """Parse the AI response for evaluation"""
-        content = response['content']
-        return {
-            'key_points': self._extract_key_points(content),
-            'concerns': self._extract_concerns(content),
-            'improvements': self._extract_improvements(content),
-            'assessment': self._extract_assessment(content)
-        }
+        fields = self._parse_response_fields(response['content'])
+        return {key: fields[key] for key in EVALUATION_FIELDS}
     
     def _parse_feedback_response(self, response: Dict[str, Any]) -> str:
         """Parse the AI response for feedback"""
@@ -104,84 +153,130 @@ class BoardAgent(ABC):
     
     def _parse_vote_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
         """Parse the AI response for voting"""
-        content = response['content']
+        fields = self._parse_response_fields(response['content'])
+        return {key: fields[key] for key in VOTE_FIELDS}
+    
+    def _parse_response_fields(self, content: str) -> Dict[str, Any]:
+        """Every structured field of a response, from its JSON object or else its labelled sections"""
+        parsed = self._load_json_object(content)
+        if parsed is not None:
+            return {
+                'key_points': self._json_list(parsed, 'key_points'),
+                'concerns': self._json_list(parsed, 'concerns'),
+                'improvements': self._json_list(parsed, 'improvements'),
+                'suggestions': self._json_list(parsed, 'suggestions'),
+                'assessment': str(parsed.get('assessment', '')),
+                'rationale': str(parsed.get('rationale', '')),
+                'vote': self._extract_vote(str(parsed.get('vote', '')))
+            }
+        return self._parse_sections(content)
+    
+    def _parse_sections(self, content: str) -> Dict[str, Any]:
+        """Every structured field of a prose response, from one scan of its labelled sections"""
+        sections = self._extract_sections(content)
         return {
-            'vote': self._extract_vote(content),
-            'rationale': self._extract_rationale(content),
-            'concerns': self._extract_concerns(content),
-            'suggestions': self._extract_suggestions(content)
-        } 
+            'key_points': self._extract_key_points(content),
+            'concerns': self._extract_concerns(sections),
+            'improvements': self._extract_improvements(sections),
+            'suggestions': self._extract_suggestions(sections),
+            'assessment': self._extract_assessment(sections),
+            'rationale': self._extract_rationale(sections),
+            # Prefer an explicit vote section over vote words elsewhere in the text
+            'vote': self._extract_vote(sections.get('vote', content))
+        }
+    
+    async def _stream_vote_response(self, prompt: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Stream a voting response, stopping once the vote and every section it needs are complete"""
+        content = ''
+        stream = self.ai.generate_response_stream(prompt, self.role, context, tier='strong')
+        try:
+            try:
+                async for text in stream:
+                    content += text
+                    # A JSON answer is complete once its object parses; a prose one once its sections close
+                    if text.rstrip().endswith('}') and self._load_json_object(content) is not None:
+                        break
+                    if '\n' in text and self._vote_sections_complete(content):
+                        break
+            finally:
+                # Closing the stream ends generation and frees its request slot now rather than at garbage collection
+                await stream.aclose()
+        except TRANSIENT_ERRORS as e:
+            # Streams are not retried, so a rate limit or dropped connection falls back to the retried request
+            self.logger.warning("Vote stream failed, requesting the vote without streaming: %s", e)
+            response = await self.ai.generate_response(prompt, self.role, context, tier='strong')
+            content = response['content']
+        return self._parse_vote_response({'content': content})
+    
+    def _vote_sections_complete(self, content: str) -> bool:
+        """Whether the rationale, concerns and suggestions have each been closed by a blank line"""
+        closed = {
+            SECTION_ALIASES[match.group(1).lower()]
+            for match in SECTION_RE.finditer(content)
+            if match.group(0).endswith('\n')
+        }
+        return VOTE_SECTIONS <= closed
+    
+    def _load_json_object(self, content: str) -> Dict[str, Any]:
+        """Parse a response that is a JSON object, or return None for prose"""
+        content = content.strip()
+        if not content.startswith('{'):
+            return None
+        try:
+            parsed = orjson.loads(content) if orjson else json.loads(content)
+        except ValueError:
+            return None
+        return parsed if isinstance(parsed, dict) else None
+    
+    def _json_list(self, parsed: Dict[str, Any], key: str) -> List[str]:
+        """Read a list of strings from a parsed response, tolerating a single string"""
+        value = parsed.get(key, [])
+        if isinstance(value, str):
+            return [value] if value else []
+        return [str(item) for item in value] if isinstance(value, list) else []
+    
+    def _extract_sections(self, content: str) -> Dict[str, str]:
+        """Split AI response into labelled sections in a single pass, keeping the first of each kind"""
+        sections = {}
+        for match in SECTION_RE.finditer(content):
+            sections.setdefault(SECTION_ALIASES[match.group(1).lower()], match.group(2))
+        return sections
+    
+    def _section_items(self, section: str) -> List[str]:
+        """Split a section body into its non-empty lines"""
+        return [item.strip().strip('- ') for item in section.split('\n') if item.strip()]
     
     def _extract_key_points(self, content: str) -> List[str]:
         """Extract key points from AI response"""
-        # Split by newlines and look for bullet points or numbered items
-        lines = content.split('\n')
-        key_points = []
-        for line in lines:
-            line = line.strip()
-            if line.startswith(('- ', '• ', '* ', '1. ', '2. ')):
-                key_points.append(line.lstrip('- •*123456789. '))
-        return key_points
-    
-    def _extract_concerns(self, content: str) -> List[str]:
+        # Bullet points or numbered items, one per line
+        return [point.strip() for point in BULLET_RE.findall(content)]
+    
+    def _extract_concerns(self, sections: Dict[str, str]) -> List[str]:
         """Extract concerns from AI response"""
-        concerns = []
         # Look for sections mentioning concerns, risks, or challenges
-        sections = content.lower().split('concerns:' or 'risks:' or 'challenges:')
-        if len(sections) > 1:
-            concern_section = sections[1].split('\n\n')[0]
-            concerns = [c.strip('- ') for c in concern_section.split('\n') if c.strip()]
-        return concerns
+        return self._section_items(sections.get('concerns', ''))
     
-    def _extract_improvements(self, content: str) -> List[str]:
+    def _extract_improvements(self, sections: Dict[str, str]) -> List[str]:
         """Extract suggested improvements from AI response"""
-        improvements = []
-        sections = content.lower().split('improvements:' or 'suggestions:' or 'recommendations:')
-        if len(sections) > 1:
-            improvement_section = sections[1].split('\n\n')[0]
-            improvements = [i.strip('- ') for i in improvement_section.split('\n') if i.strip()]
-        return improvements
-    
-    def _extract_assessment(self, content: str) -> str:
+        return self._section_items(sections.get('improvements', sections.get('suggestions', '')))
+    
+    def _extract_assessment(self, sections: Dict[str, str]) -> str:
         """Extract overall assessment from AI response"""
-        sections = content.lower().split('assessment:' or 'conclusion:' or 'summary:')
-        if len(sections) > 1:
-            return sections[1].split('\n\n')[0].strip()
-        return ""
+        return sections.get('assessment', '').strip()
     
     def _extract_vote(self, content: str) -> str:
         """Extract vote decision from AI response"""
-        vote_map = {
-            'support': 'support',
-            'approve': 'support',
-            'yes': 'support',
-            'oppose': 'oppose',
-            'reject': 'oppose',
-            'no': 'oppose',
-            'abstain': 'abstain'
-        }
-        
-        content_lower = content.lower()
-        for key, value in vote_map.items():
-            if key in content_lower:
-                return value
-        return 'abstain'
+        # The first vote word in the response decides
+        match = VOTE_RE.search(content)
+        return VOTE_MAP[match.group(1).lower()] if match else 'abstain'
     
-    def _extract_rationale(self, content: str) -> str:
+    def _extract_rationale(self, sections: Dict[str, str]) -> str:
         """Extract voting rationale from AI response"""
-        sections = content.lower().split('rationale:' or 'reasoning:' or 'because:')
-        if len(sections) > 1:
-            return sections[1].split('\n\n')[0].strip()
-        return ""
+        return sections.get('rationale', '').strip()
     
-    def _extract_suggestions(self, content: str) -> List[str]:
+    def _extract_suggestions(self, sections: Dict[str, str]) -> List[str]:
         """Extract suggestions from AI response"""
-        suggestions = []
-        sections = content.lower().split('suggestions:' or 'modifications:' or 'recommendations:')
-        if len(sections) > 1:
-            suggestion_section = sections[1].split('\n\n')[0]
-            suggestions = [s.strip('- ') for s in suggestion_section.split('\n') if s.strip()]
-        return suggestions 
+        return self._section_items(sections.get('suggestions', ''))
     
     def _load_config(self, file_path: str) -> Dict[str, Any]:
         """Load and validate config file"""
@@ -202,13 +297,56 @@ class BoardAgent(ABC):
         if missing_keys:
             raise ValueError(f"Missing required config keys: {missing_keys}") 
     
-    async def _safe_ai_call(self, prompt: str, role: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _safe_ai_call(self, prompt: str, role: str, context: Dict[str, Any],
+                            tier: str = 'balanced') -> Dict[str, Any]:
         """Safely make AI API calls with retries and error handling"""
+        key = self._response_cache_key(prompt, role, context, tier)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+            return copy.deepcopy(cached)
+        
         try:
-            return await self.ai.generate_response(prompt, role, context)
+            response = await self.ai.generate_response(prompt, role, context, tier)
         except Exception as e:
             self.logger.error(f"Error in AI call: {str(e)}")
             return {
                 'content': "Error generating response. Please try again.",
                 'error': str(e)
-            } 
\ No newline at end of file
+            }
+        
+        self._response_cache[key] = copy.deepcopy(response)
+        if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        return response
+    
+    async def _memoized_evaluation(self, proposal: Dict[str, Any],
+                                   evaluate: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Evaluate a proposal, reusing the result for an identical proposal seen earlier"""
+        key = self._proposal_key(proposal)
+        cached = self._evaluation_cache.get(key)
+        if cached is not None:
+            self._evaluation_cache.move_to_end(key)
+            return copy.deepcopy(cached)
+        
+        evaluation = await evaluate(proposal)
+        self._evaluation_cache[key] = copy.deepcopy(evaluation)
+        if len(self._evaluation_cache) > self.EVALUATION_CACHE_SIZE:
+            self._evaluation_cache.popitem(last=False)
+        return evaluation
+    
+    def _proposal_key(self, proposal: Dict[str, Any]) -> bytes:
+        """Digest of a proposal's contents, independent of key order"""
+        if orjson:
+            payload = orjson.dumps(proposal, option=orjson.OPT_SORT_KEYS, default=str)
+        else:
+            payload = json.dumps(proposal, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=16).digest()
+    
+    def _response_cache_key(self, prompt: str, role: str, context: Dict[str, Any], tier: str) -> bytes:
+        """Digest of everything that shapes a response: the prompt, the role, the tier and the discussion state"""
+        # Only these context fields reach the system prompt
+        state = (context.get('round', 1), context.get('topic'), context.get('consensus_score'))
+        digest = hashlib.blake2b(prompt.encode('utf-8'), digest_size=16)
+        digest.update(f"\0{role}\0{tier}\0{state!r}".encode('utf-8'))
+        return digest.digest()
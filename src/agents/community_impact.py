@@ -1,11 +1,10 @@
 from typing import Dict, List, Any
 from .base import BoardAgent
-import yaml
+from src.utils.prompt_config import load_role_config
 
 class CommunityImpactAgent(BoardAgent):
     def __init__(self):
-        with open('src/prompts/community_impact.yaml', 'r') as file:
-            config = yaml.safe_load(file)
+        config = load_role_config('src/prompts/community_impact.yaml')
             
         super().__init__(
             role="Community Impact Officer",
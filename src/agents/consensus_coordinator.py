@@ -1,17 +1,18 @@
 from typing import Dict, List, Any
 from src.agents.base import BoardAgent
+from src.ai.claude_integration import ClaudeAI
 from src.consensus.consensus_algorithm import ConsensusAlgorithm
-import yaml
+from src.utils.prompt_config import load_role_config
 
 class ConsensusCoordinatorAgent(BoardAgent):
-    def __init__(self, config: Dict[str, Any]):
-        with open('src/prompts/consensus_coordinator.yaml', 'r') as file:
-            role_config = yaml.safe_load(file)
+    def __init__(self, config: Dict[str, Any], ai: ClaudeAI = None):
+        role_config = load_role_config('src/prompts/consensus_coordinator.yaml')
             
         super().__init__(
             role="Consensus Coordinator",
             priorities=role_config['priorities'],
-            config=config
+            config=config,
+            ai=ai
         )
         self.prompts = role_config['prompts']
         self.evaluation_criteria = role_config['evaluation_criteria']
@@ -21,32 +22,42 @@ class ConsensusCoordinatorAgent(BoardAgent):
     async def evaluate_proposal(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate proposal from consensus perspective"""
         evaluation = {
-            'consensus_potential': await self._assess_consensus_potential(proposal),
-            'stakeholder_alignment': await self._assess_stakeholder_alignment(proposal),
-            'discussion_strategy': await self._develop_discussion_strategy(proposal),
-            'compromise_opportunities': await self._identify_compromise_opportunities(proposal)
+            'consensus_potential': self._assess_consensus_potential(proposal),
+            'stakeholder_alignment': self._assess_stakeholder_alignment(proposal),
+            'discussion_strategy': self._develop_discussion_strategy(proposal),
+            'compromise_opportunities': self._identify_compromise_opportunities(proposal)
         }
+        
+        # The assessments do not depend on the AI's answers, so only render and ask when analysis is wanted
+        if self.config.get('use_llm_assessments', False):
+            try:
+                # Each assessed aspect contributes its prompt to one combined AI request
+                prompts = {name: self._render_prompt(name, proposal) for name in evaluation}
+                evaluation['analysis'] = await self.ai.generate_batch(prompts, self.role, proposal, tier='fast')
+            except Exception as e:
+                self.logger.error(f"Error generating consensus analysis: {str(e)}")
+                evaluation['analysis'] = {}
+        
         evaluation['overall_recommendation'] = self._generate_recommendation(evaluation)
         return evaluation
 
     async def generate_feedback(self, context: Dict[str, Any]) -> str:
         """Generate consensus-focused feedback"""
-        prompt = self.prompts['feedback'].format(**context)
+        prompt = self._render_prompt('feedback', context)
         response = await self.ai.generate_response(prompt, self.role, context)
         return response['content']
 
     async def vote(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
         """Cast vote based on consensus analysis"""
         evaluation = await self.evaluate_proposal(proposal)
-        prompt = self.prompts['voting'].format(
-            evaluation=evaluation,
-            proposal=proposal
-        )
-        response = await self.ai.generate_response(prompt, self.role, {
+        prompt = self._render_prompt('voting', {
+            'evaluation': evaluation,
+            'proposal': proposal
+        })
+        return await self._stream_vote_response(prompt, {
             'evaluation': evaluation,
             'proposal': proposal
         })
-        return self._parse_vote_response(response)
 
     async def moderate_discussion(self, agent_responses: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Moderate the discussion between agents"""
@@ -70,44 +81,32 @@ class ConsensusCoordinatorAgent(BoardAgent):
             'next_steps': analysis['next_steps']
         }
 
-    async def _assess_consensus_potential(self, proposal: Dict[str, Any]) -> Dict[str, float]:
+    def _assess_consensus_potential(self, proposal: Dict[str, Any]) -> Dict[str, float]:
         """Assess potential for reaching consensus"""
-        prompt = self.prompts['consensus_potential'].format(**proposal)
-        response = await self.ai.generate_response(prompt, self.role, proposal)
-        
         return {
             'alignment_potential': 0.75,
             'compromise_feasibility': 0.8,
             'discussion_complexity': 0.6
         }
 
-    async def _assess_stakeholder_alignment(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_stakeholder_alignment(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
         """Assess alignment between stakeholders"""
-        prompt = self.prompts['stakeholder_alignment'].format(**proposal)
-        response = await self.ai.generate_response(prompt, self.role, proposal)
-        
         return {
             'interest_alignment': 0.7,
             'priority_conflicts': ['budget allocation', 'timeline'],
             'common_ground': ['research value', 'innovation potential']
         }
 
-    async def _develop_discussion_strategy(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
+    def _develop_discussion_strategy(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
         """Develop strategy for facilitating discussion"""
-        prompt = self.prompts['discussion_strategy'].format(**proposal)
-        response = await self.ai.generate_response(prompt, self.role, proposal)
-        
         return {
             'focus_points': ['budget concerns', 'resource allocation'],
             'discussion_structure': ['individual perspectives', 'group discussion'],
             'facilitation_approach': 'structured dialogue'
         }
 
-    async def _identify_compromise_opportunities(self, proposal: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _identify_compromise_opportunities(self, proposal: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Identify potential areas for compromise"""
-        prompt = self.prompts['compromise_opportunities'].format(**proposal)
-        response = await self.ai.generate_response(prompt, self.role, proposal)
-        
         return [
             {
                 'aspect': 'budget allocation',
@@ -123,8 +122,8 @@ class ConsensusCoordinatorAgent(BoardAgent):
 
     async def _generate_moderation_response(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Generate moderation response based on analysis"""
-        prompt = self.prompts['moderation'].format(**analysis)
-        response = await self.ai.generate_response(prompt, self.role, analysis)
+        prompt = self._render_prompt('moderation', analysis)
+        response = await self.ai.generate_response(prompt, self.role, analysis, tier='strong')
         
         return {
             'summary': self._summarize_current_state(analysis),
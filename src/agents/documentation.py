@@ -1,75 +1,154 @@
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any
+from collections import deque
 from src.agents.base import BoardAgent
-import yaml
+from src.ai.claude_integration import ClaudeAI
+import asyncio
+import json
+from src.utils.prompt_config import load_role_config
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class DocumentationAgent(BoardAgent):
-    def __init__(self, config: Dict[str, Any]):
-        with open('src/prompts/documentation.yaml', 'r') as file:
-            role_config = yaml.safe_load(file)
+    EVALUATION_ASPECTS = (
+        'tracking_complexity',
+        'record_keeping_strategy',
+        'transparency_measures'
+    )
+    
+    # Recent discussion records kept in memory; older ones live only in the discussion log
+    HISTORY_SIZE = 50
+    
+    def __init__(self, config: Dict[str, Any], ai: ClaudeAI = None):
+        role_config = load_role_config('src/prompts/documentation.yaml')
         
         super().__init__(
             role="Documentation Officer",
             priorities=role_config['priorities'],
-            config=config
+            config=config,
+            ai=ai
         )
         self.prompts = role_config['prompts']
         self.evaluation_criteria = role_config['evaluation_criteria']
-        self.discussion_history = []
+        self.discussion_history = deque(maxlen=self.HISTORY_SIZE)
+        self.discussion_log_path = config.get('discussion_log_path')
         self.decision_records = {}
     
     async def evaluate_proposal(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate proposal from documentation perspective"""
         evaluation = {
-            'documentation_requirements': await self._assess_documentation_needs(proposal),
-            'tracking_complexity': await self._assess_tracking_complexity(proposal),
-            'record_keeping_strategy': await self._develop_record_strategy(proposal),
-            'transparency_measures': await self._identify_transparency_measures(proposal)
+            'documentation_requirements': self._assess_documentation_needs(proposal)
         }
+        results = await asyncio.gather(
+            self._assess_tracking_complexity(proposal),
+            self._develop_record_strategy(proposal),
+            self._identify_transparency_measures(proposal)
+        )
+        evaluation.update(zip(self.EVALUATION_ASPECTS, results))
+        
+        # The assessments do not depend on the AI's answers, so only render and ask when analysis is wanted
+        if self.config.get('use_llm_assessments', False):
+            try:
+                prompts = {'documentation_needs': self._render_prompt('documentation_needs', proposal)}
+                evaluation['analysis'] = await self.ai.generate_batch(prompts, self.role, proposal, tier='fast')
+            except Exception as e:
+                self.logger.error(f"Error generating documentation analysis: {str(e)}")
+                evaluation['analysis'] = {}
         evaluation['overall_recommendation'] = self._generate_recommendation(evaluation)
         return evaluation
 
     async def generate_feedback(self, context: Dict[str, Any]) -> str:
         """Generate documentation-focused feedback"""
-        prompt = self.prompts['feedback'].format(**context)
+        prompt = self._render_prompt('feedback', context)
         response = await self.ai.generate_response(prompt, self.role, context)
         return response['content']
 
     async def vote(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
         """Cast vote based on documentation considerations"""
         evaluation = await self.evaluate_proposal(proposal)
-        prompt = self.prompts['voting'].format(
-            evaluation=evaluation,
-            proposal=proposal
-        )
-        response = await self.ai.generate_response(prompt, self.role, {
+        prompt = self._render_prompt('voting', {
+            'evaluation': evaluation,
+            'proposal': proposal
+        })
+        return await self._stream_vote_response(prompt, {
             'evaluation': evaluation,
             'proposal': proposal
         })
-        return self._parse_vote_response(response)
 
     async def record_discussion(self, discussion_data: Dict[str, Any]) -> Dict[str, Any]:
         """Record and structure discussion points"""
         timestamp = datetime.now().isoformat()
         
+        # Each section is derived independently from the discussion data
+        key_points, evaluations, consensus_analysis, votes, decision, action_items = await asyncio.gather(
+            self._extract_key_points(discussion_data),
+            self._summarize_evaluations(discussion_data['evaluations']),
+            self._summarize_consensus(discussion_data['consensus_analysis']),
+            self._record_votes(discussion_data['votes']),
+            self._determine_final_decision(discussion_data),
+            self._identify_action_items(discussion_data)
+        )
+        
         record = {
             'timestamp': timestamp,
             'proposal': discussion_data['proposal'],
-            'key_points': await self._extract_key_points(discussion_data),
-            'evaluations': await self._summarize_evaluations(discussion_data['evaluations']),
-            'consensus_analysis': await self._summarize_consensus(discussion_data['consensus_analysis']),
-            'votes': await self._record_votes(discussion_data['votes']),
-            'decision': await self._determine_final_decision(discussion_data),
-            'action_items': await self._identify_action_items(discussion_data)
+            'key_points': key_points,
+            'evaluations': evaluations,
+            'consensus_analysis': consensus_analysis,
+            'votes': votes,
+            'decision': decision,
+            'action_items': action_items
         }
         
         self.discussion_history.append(record)
+        self._append_to_log(record)
         return record
 
+    def iter_discussion_log(self) -> Iterator[Dict[str, Any]]:
+        """Stream every recorded discussion from the log, oldest first"""
+        if not self.discussion_log_path:
+            yield from self.discussion_history
+            return
+        
+        try:
+            with open(self.discussion_log_path, 'rb') as log:
+                for line in log:
+                    yield orjson.loads(line) if orjson else json.loads(line)
+        except FileNotFoundError:
+            return
+
+    def _append_to_log(self, record: Dict[str, Any]) -> None:
+        """Append a record to the discussion log as one JSON line"""
+        if not self.discussion_log_path:
+            return
+        
+        try:
+            if orjson:
+                line = orjson.dumps(record, default=str) + b'\n'
+            else:
+                line = (json.dumps(record, default=str) + '\n').encode('utf-8')
+            with open(self.discussion_log_path, 'ab') as log:
+                log.write(line)
+        except (OSError, TypeError) as e:
+            self.logger.error(f"Error writing discussion log: {str(e)}")
+
     async def generate_minutes(self, discussion_data: Dict[str, Any]) -> str:
         """Generate formatted meeting minutes"""
-        prompt = self.prompts['minutes_generation'].format(**discussion_data)
-        response = await self.ai.generate_response(prompt, self.role, discussion_data)
+        prompt = self._render_prompt('minutes_generation', discussion_data)
+        
+        # Format the minutes sections alongside the AI call
+        response, key_points, evaluations, consensus_analysis, voting_results, decision, action_items = await asyncio.gather(
+            self.ai.generate_response(prompt, self.role, discussion_data, tier='fast'),
+            self._format_key_points(discussion_data),
+            self._format_evaluations(discussion_data['evaluations']),
+            self._format_consensus_analysis(discussion_data['consensus_analysis']),
+            self._format_voting_results(discussion_data['votes']),
+            self._format_decision(discussion_data),
+            self._format_action_items(discussion_data)
+        )
         
         minutes = f"""
         Board Discussion Minutes
@@ -78,32 +157,29 @@ class DocumentationAgent(BoardAgent):
         Proposal: {discussion_data['proposal']['title']}
         
         1. Key Points Discussed:
-        {await self._format_key_points(discussion_data)}
+        {key_points}
         
         2. Agent Evaluations:
-        {await self._format_evaluations(discussion_data['evaluations'])}
+        {evaluations}
         
         3. Consensus Analysis:
-        {await self._format_consensus_analysis(discussion_data['consensus_analysis'])}
+        {consensus_analysis}
         
         4. Voting Results:
-        {await self._format_voting_results(discussion_data['votes'])}
+        {voting_results}
         
         5. Decision:
-        {await self._format_decision(discussion_data)}
+        {decision}
         
         6. Action Items:
-        {await self._format_action_items(discussion_data)}
+        {action_items}
         
         Minutes recorded by: Documentation Officer
         """
         return minutes
 
-    async def _assess_documentation_needs(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_documentation_needs(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
         """Assess documentation requirements"""
-        prompt = self.prompts['documentation_needs'].format(**proposal)
-        response = await self.ai.generate_response(prompt, self.role, proposal)
-        
         return {
             'complexity_level': 'high',
             'required_templates': ['decision record', 'meeting minutes'],
@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, Dict, List, Tuple
+
+@dataclass(frozen=True)
+class ProposalFeatures:
+    """Derived proposal quantities, each computed at most once per evaluation"""
+    proposal: Dict[str, Any]
+
+    @cached_property
+    def budget(self) -> float:
+        return self.proposal.get('budget', 0)
+
+    @cached_property
+    def department(self) -> str:
+        return self.proposal.get('department', '')
+
+    @cached_property
+    def staffing(self) -> Dict[str, Any]:
+        return self.proposal.get('staffing', {})
+
+    @cached_property
+    def space_requirements(self) -> Dict[str, Any]:
+        return self.proposal.get('space_requirements', {})
+
+    @cached_property
+    def funding_sources(self) -> Dict[str, Any]:
+        return self.proposal.get('funding_sources', {})
+
+    @cached_property
+    def research_areas(self) -> List[str]:
+        return self.proposal.get('research_areas', [])
+
+    @cached_property
+    def research_areas_lower(self) -> Tuple[str, ...]:
+        """Research areas lowercased once for keyword matching"""
+        return tuple(area.lower() for area in self.research_areas)
+
+    @cached_property
+    def research_area_count(self) -> int:
+        return len(self.research_areas)
+
+    @cached_property
+    def has_ai_research(self) -> bool:
+        """Whether any research area mentions AI"""
+        return any('AI' in area for area in self.research_areas)
+
+    @cached_property
+    def stakeholder_count(self) -> int:
+        """Number of staffing categories involved"""
+        return len(self.staffing)
+
+    @cached_property
+    def faculty(self) -> int:
+        return self.staffing.get('faculty', 0)
+
+    @cached_property
+    def staff(self) -> int:
+        return self.staffing.get('staff', 0)
+
+    @cached_property
+    def graduate_students(self) -> int:
+        return self.staffing.get('graduate_students', 0)
+
+    @cached_property
+    def team_size(self) -> int:
+        """Faculty, staff and graduate students"""
+        return self.faculty + self.staff + self.graduate_students
+
+    @cached_property
+    def headcount(self) -> int:
+        """Total people to house, counting at least one faculty member when unspecified"""
+        return (self.staffing.get('faculty', 1) +
+                self.staffing.get('staff', 0) +
+                self.graduate_students)
+
+    @cached_property
+    def total_staff(self) -> int:
+        """Everyone listed in the staffing plan"""
+        return sum(self.staffing.values())
+
+    @cached_property
+    def total_space(self) -> float:
+        return sum(self.space_requirements.values())
+
+    @cached_property
+    def lab_space(self) -> float:
+        return self.space_requirements.get('research_labs', 0)
+
+    @cached_property
+    def office_space(self) -> float:
+        return self.space_requirements.get('offices', 0)
+
+    @cached_property
+    def common_space(self) -> float:
+        return self.space_requirements.get('common_areas', 0)
+
+    @cached_property
+    def funding_source_count(self) -> int:
+        return len(self.funding_sources)
+
+    @cached_property
+    def funding_shares(self) -> Tuple[Tuple[str, float], ...]:
+        """Each funding source, lowercased, with its share of the budget"""
+        return tuple((source.lower(), share) for source, share in self.funding_sources.items())
+
+    @cached_property
+    def industry_funding(self) -> float:
+        return self.funding_sources.get('industry', 0)
+
+    @cached_property
+    def grant_funding(self) -> float:
+        return self.funding_sources.get('grants', 0)
+
+    @cached_property
+    def timeline_years(self) -> float:
+        return float(self.proposal.get('timeline', '1').split()[0])
@@ -1,71 +1,147 @@
 from typing import Dict, List, Any
+from types import MappingProxyType
+from src.agents import financial_scoring
 from src.agents.base import BoardAgent
-import yaml
+from src.ai.claude_integration import ClaudeAI
+from src.agents.features import ProposalFeatures
+from src.utils.prompt_config import load_role_config
+
+# Per funding source: (reliability, sustainability) of the revenue it brings
+FUNDING_SOURCE_WEIGHTS = MappingProxyType({
+    'university': (0.9, 0.9),
+    'grants': (0.7, 0.6),
+    'industry': (0.8, 0.7),
+    'donations': (0.5, 0.4)
+})
+DEFAULT_FUNDING_WEIGHTS = (0.5, 0.5)
+
+# Annual cost of each staffing role
+ANNUAL_STAFF_COSTS = MappingProxyType({
+    'faculty': 120000,
+    'staff': 60000,
+    'graduate_students': 30000
+})
+
+# Resource optimizations suggested for every proposal
+RESOURCE_OPTIMIZATIONS = (
+    MappingProxyType({
+        'area': 'space',
+        'suggestion': 'Implement shared workspace model',
+        'potential_savings': 0.15
+    }),
+    MappingProxyType({
+        'area': 'staffing',
+        'suggestion': 'Phase hiring with project milestones',
+        'potential_savings': 0.20
+    })
+)
+
+# Cost reductions, each offered when the proposal feature named first is present
+COST_REDUCTIONS = (
+    ('space_requirements', MappingProxyType({
+        'area': 'space',
+        'strategy': 'Shared facility usage',
+        'potential_savings': 0.15
+    })),
+    ('staffing', MappingProxyType({
+        'area': 'staffing',
+        'strategy': 'Phased hiring approach',
+        'potential_savings': 0.20
+    })),
+    ('funding_sources', MappingProxyType({
+        'area': 'funding',
+        'strategy': 'Grant matching program',
+        'potential_savings': 0.10
+    }))
+)
 
 class FinancialAgent(BoardAgent):
-    def __init__(self, config: Dict[str, Any]):
-        with open('src/prompts/financial.yaml', 'r') as file:
-            role_config = yaml.safe_load(file)
+    __slots__ = ('prompts', 'evaluation_criteria')
+    
+    def __init__(self, config: Dict[str, Any], ai: ClaudeAI = None):
+        role_config = load_role_config('src/prompts/financial.yaml')
         
         super().__init__(
             role="Financial Officer",
             priorities=role_config['priorities'],
-            config=config
+            config=config,
+            ai=ai
         )
         self.prompts = role_config['prompts']
         self.evaluation_criteria = role_config['evaluation_criteria']
     
     async def evaluate_proposal(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate proposals with focus on financial impact"""
+        # vote re-evaluates the proposal the board has just evaluated
+        return await self._memoized_evaluation(proposal, self._evaluate_proposal)
+
+    async def _evaluate_proposal(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
+        """Score every financial aspect of a proposal"""
+        # Derived quantities are shared by the assessments below
+        features = ProposalFeatures(proposal)
+        
         evaluation = {
-            'budget_analysis': await self._assess_budget_impact(proposal),
-            'resource_allocation': await self._assess_resource_allocation(proposal),
-            'financial_sustainability': await self._assess_financial_sustainability(proposal),
-            'roi_projection': await self._assess_roi(proposal)
+            'budget_analysis': self._assess_budget_impact(proposal, features),
+            'resource_allocation': self._assess_resource_allocation(proposal, features),
+            'financial_sustainability': self._assess_financial_sustainability(proposal, features),
+            'roi_projection': self._assess_roi(proposal, features)
         }
+        
+        # The assessments do not depend on the AI's answers, so only render and ask when analysis is wanted
+        if self.config.get('use_llm_assessments', False):
+            try:
+                prompts = self._build_analysis_prompts(proposal, features)
+                evaluation['analysis'] = await self.ai.generate_batch(prompts, self.role, proposal)
+            except Exception as e:
+                self.logger.error(f"Error generating financial analysis: {str(e)}")
+                evaluation['analysis'] = {}
+        
         evaluation['overall_recommendation'] = self._generate_recommendation(evaluation)
         return evaluation
 
     async def generate_feedback(self, context: Dict[str, Any]) -> str:
         """Generate financial perspective feedback"""
-        prompt = self.prompts['feedback'].format(**context)
+        prompt = self._render_prompt('feedback', context)
         response = await self.ai.generate_response(prompt, self.role, context)
         return response['content']
 
     async def vote(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
         """Cast vote with financial rationale"""
         evaluation = await self.evaluate_proposal(proposal)
-        prompt = self.prompts['voting'].format(
-            evaluation=evaluation,
-            proposal=proposal
-        )
+        prompt = self._render_prompt('voting', {
+            'evaluation': evaluation,
+            'proposal': proposal
+        })
         response = await self.ai.generate_response(prompt, self.role, {
             'evaluation': evaluation,
             'proposal': proposal
         })
         return self._parse_vote_response(response)
 
-    async def _assess_budget_impact(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_analysis_prompts(self, proposal: Dict[str, Any], features: ProposalFeatures) -> Dict[str, str]:
+        """Render the prompt for each assessed aspect, for one combined AI request"""
+        return {
+            'budget_analysis': self._render_prompt('budget_analysis', {
+                'budget': features.budget,
+                'timeline': proposal.get('timeline', 'Not specified'),
+                'funding_sources': features.funding_sources
+            }),
+            'resource_allocation': self._render_prompt('resource_allocation', proposal),
+            'sustainability': self._render_prompt('sustainability', proposal),
+            'roi_analysis': self._render_prompt('roi_analysis', proposal)
+        }
+
+    def _assess_budget_impact(self, proposal: Dict[str, Any], features: ProposalFeatures) -> Dict[str, Any]:
         """Assess budget impact and financial requirements"""
         try:
-            prompt = self.prompts['budget_analysis'].format(
-                budget=proposal.get('budget', 0),
-                timeline=proposal.get('timeline', 'Not specified'),
-                funding_sources=proposal.get('funding_sources', {})
-            )
-            response = await self.ai.generate_response(prompt, self.role, proposal)
-            
-            budget = proposal.get('budget', 0)
-            funding_sources = proposal.get('funding_sources', {})
-            
             return {
-                'immediate_cost': budget,
-                'annual_impact': self._calculate_annual_impact(proposal),
-                'funding_sources': self._identify_funding_sources(proposal),
-                'risk_assessment': self._assess_financial_risk(proposal)
+                'immediate_cost': features.budget,
+                'annual_impact': self._calculate_annual_impact(features),
+                'funding_sources': self._identify_funding_sources(features),
+                'risk_assessment': self._assess_financial_risk(features)
             }
         except KeyError as e:
-            print(f"Warning: Missing key in proposal for budget analysis: {e}")
+            self.logger.warning("Missing key in proposal for budget analysis: %s", e)
             return {
                 'immediate_cost': 0,
                 'annual_impact': 0,
@@ -73,36 +149,27 @@ class FinancialAgent(BoardAgent):
                 'risk_assessment': {'budget_overrun': 1.0}
             }
 
-    async def _assess_resource_allocation(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_resource_allocation(self, proposal: Dict[str, Any], features: ProposalFeatures) -> Dict[str, Any]:
         """Assess resource allocation efficiency"""
-        prompt = self.prompts['resource_allocation'].format(**proposal)
-        response = await self.ai.generate_response(prompt, self.role, proposal)
-        
         return {
-            'efficiency': self._evaluate_resource_efficiency(proposal),
-            'distribution': self._analyze_resource_distribution(proposal),
-            'optimization': self._suggest_resource_optimization(proposal)
+            'efficiency': self._evaluate_resource_efficiency(features),
+            'distribution': self._analyze_resource_distribution(features),
+            'optimization': self._suggest_resource_optimization(features)
         }
 
-    async def _assess_financial_sustainability(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_financial_sustainability(self, proposal: Dict[str, Any], features: ProposalFeatures) -> Dict[str, Any]:
         """Assess long-term financial sustainability"""
-        prompt = self.prompts['sustainability'].format(**proposal)
-        response = await self.ai.generate_response(prompt, self.role, proposal)
-        
         return {
-            'long_term_viability': self._evaluate_long_term_viability(proposal),
-            'revenue_potential': self._assess_revenue_potential(proposal),
-            'cost_reduction_opportunities': self._identify_cost_reductions(proposal)
+            'long_term_viability': self._evaluate_long_term_viability(features),
+            'revenue_potential': self._assess_revenue_potential(features),
+            'cost_reduction_opportunities': self._identify_cost_reductions(features)
         }
 
-    async def _assess_roi(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_roi(self, proposal: Dict[str, Any], features: ProposalFeatures) -> Dict[str, Any]:
         """Project return on investment"""
-        prompt = self.prompts['roi_analysis'].format(**proposal)
-        response = await self.ai.generate_response(prompt, self.role, proposal)
-        
-        costs = self._calculate_total_costs(proposal)
-        benefits = self._project_benefits(proposal)
-        timeline = float(proposal.get('timeline', '1').split()[0])
+        costs = self._calculate_total_costs(features)
+        benefits = self._project_benefits(features)
+        timeline = features.timeline_years
         
         roi = (benefits - costs) / costs if costs > 0 else 0
         
@@ -127,257 +194,174 @@ class FinancialAgent(BoardAgent):
         else:
             return "Oppose" 
 
-    def _calculate_annual_impact(self, proposal: Dict[str, Any]) -> float:
+    def _calculate_annual_impact(self, features: ProposalFeatures) -> float:
         """Calculate annual financial impact"""
-        total_budget = proposal.get('budget', 0)
-        timeline_years = float(proposal.get('timeline', '1').split()[0])
-        return total_budget / timeline_years
+        return features.budget / features.timeline_years
 
-    def _identify_funding_sources(self, proposal: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    def _identify_funding_sources(self, features: ProposalFeatures) -> Dict[str, Dict[str, float]]:
         """Analyze funding sources and their reliability"""
-        funding_sources = proposal.get('funding_sources', {})
         return {
             source: {
-                'amount': proposal.get('budget', 0) * percentage,
+                'amount': features.budget * percentage,
                 'reliability': self._assess_funding_reliability(source)
             }
-            for source, percentage in funding_sources.items()
+            for source, percentage in features.funding_sources.items()
         }
 
     def _assess_funding_reliability(self, source: str) -> float:
         """Assess reliability of funding source"""
-        reliability_scores = {
-            'university': 0.9,
-            'grants': 0.7,
-            'industry': 0.8,
-            'donations': 0.5
-        }
-        return reliability_scores.get(source.lower(), 0.5)
+        return FUNDING_SOURCE_WEIGHTS.get(source.lower(), DEFAULT_FUNDING_WEIGHTS)[0]
 
-    def _assess_financial_risk(self, proposal: Dict[str, Any]) -> Dict[str, float]:
+    def _assess_financial_risk(self, features: ProposalFeatures) -> Dict[str, float]:
         """Assess various financial risks"""
         return {
-            'budget_overrun': self._calculate_overrun_risk(proposal),
-            'funding_stability': self._assess_funding_stability(proposal),
-            'operational_risk': self._assess_operational_risk(proposal)
+            'budget_overrun': self._calculate_overrun_risk(features),
+            'funding_stability': self._assess_funding_stability(features),
+            'operational_risk': self._assess_operational_risk(features)
         }
 
-    def _calculate_overrun_risk(self, proposal: Dict[str, Any]) -> float:
+    def _calculate_overrun_risk(self, features: ProposalFeatures) -> float:
         """Calculate risk of budget overrun"""
-        budget = proposal.get('budget', 0)
-        timeline = float(proposal.get('timeline', '1').split()[0])
-        complexity = len(proposal.get('research_areas', []))
-        
-        # Higher budget, longer timeline, and more complexity increase risk
-        risk = (
-            0.3 * min(budget / 1000000, 1.0) +  # Budget factor
-            0.3 * min(timeline / 5, 1.0) +      # Timeline factor
-            0.4 * min(complexity / 5, 1.0)      # Complexity factor
+        return financial_scoring.overrun_risk_score(
+            features.budget, features.timeline_years, features.research_area_count
         )
-        return risk
 
-    def _assess_funding_stability(self, proposal: Dict[str, Any]) -> float:
+    def _assess_funding_stability(self, features: ProposalFeatures) -> float:
         """Assess stability of funding sources"""
-        funding_sources = proposal.get('funding_sources', {})
+        funding_sources = features.funding_sources
         if not funding_sources:
             return 1.0  # Maximum risk if no funding sources specified
         
         weighted_stability = sum(
-            percentage * self._assess_funding_reliability(source)
-            for source, percentage in funding_sources.items()
+            share * FUNDING_SOURCE_WEIGHTS.get(source, DEFAULT_FUNDING_WEIGHTS)[0]
+            for source, share in features.funding_shares
         )
         return 1.0 - weighted_stability  # Convert to risk score
 
-    def _assess_operational_risk(self, proposal: Dict[str, Any]) -> float:
+    def _assess_operational_risk(self, features: ProposalFeatures) -> float:
         """Assess operational financial risks"""
-        staffing = proposal.get('staffing', {})
-        space = proposal.get('space_requirements', {})
-        
-        staff_cost_risk = min(sum(staffing.values()) * 0.1, 1.0)
-        space_cost_risk = min(sum(space.values()) * 0.0001, 1.0)
+        staff_cost_risk = min(features.total_staff * 0.1, 1.0)
+        space_cost_risk = min(features.total_space * 0.0001, 1.0)
         
         return (staff_cost_risk + space_cost_risk) / 2
 
-    def _evaluate_resource_efficiency(self, proposal: Dict[str, Any]) -> float:
+    def _evaluate_resource_efficiency(self, features: ProposalFeatures) -> float:
         """Evaluate efficiency of resource utilization"""
-        space_reqs = proposal.get('space_requirements', {})
-        staffing = proposal.get('staffing', {})
-        
-        if not space_reqs or not staffing:
+        if not features.space_requirements or not features.staffing:
             return 0.5
         
-        space_efficiency = self._calculate_space_efficiency(space_reqs, staffing)
-        staff_efficiency = self._calculate_staff_efficiency(staffing)
+        space_efficiency = self._calculate_space_efficiency(features)
+        staff_efficiency = self._calculate_staff_efficiency(features)
         
         return (space_efficiency + staff_efficiency) / 2
 
-    def _analyze_resource_distribution(self, proposal: Dict[str, Any]) -> Dict[str, float]:
+    def _analyze_resource_distribution(self, features: ProposalFeatures) -> Dict[str, float]:
         """Analyze distribution of resources"""
         return {
-            'space_allocation': self._analyze_space_distribution(proposal),
-            'staff_allocation': self._analyze_staff_distribution(proposal),
-            'budget_allocation': self._analyze_budget_distribution(proposal)
+            'space_allocation': self._analyze_space_distribution(features),
+            'staff_allocation': self._analyze_staff_distribution(features),
+            'budget_allocation': self._analyze_budget_distribution(features)
         }
 
-    def _suggest_resource_optimization(self, proposal: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _suggest_resource_optimization(self, features: ProposalFeatures) -> List[Dict[str, Any]]:
         """Suggest ways to optimize resource usage"""
-        return [
-            {
-                'area': 'space',
-                'suggestion': 'Implement shared workspace model',
-                'potential_savings': 0.15
-            },
-            {
-                'area': 'staffing',
-                'suggestion': 'Phase hiring with project milestones',
-                'potential_savings': 0.20
-            }
-        ]
+        return [dict(option) for option in RESOURCE_OPTIMIZATIONS]
 
-    def _calculate_total_costs(self, proposal: Dict[str, Any]) -> float:
+    def _calculate_total_costs(self, features: ProposalFeatures) -> float:
         """Calculate total costs including indirect costs"""
-        direct_costs = proposal.get('budget', 0)
+        direct_costs = features.budget
         indirect_rate = 0.4  # 40% indirect cost rate
         return direct_costs * (1 + indirect_rate)
 
-    def _project_benefits(self, proposal: Dict[str, Any]) -> float:
+    def _project_benefits(self, features: ProposalFeatures) -> float:
         """Project financial benefits"""
-        budget = proposal.get('budget', 0)
-        research_areas = len(proposal.get('research_areas', []))
-        funding_mix = len(proposal.get('funding_sources', {}))
+        budget = features.budget
+        research_areas = features.research_area_count
+        funding_mix = features.funding_source_count
         
         # Simple benefit projection model
         return budget * (1.5 + 0.1 * research_areas + 0.1 * funding_mix)
 
     def _calculate_npv(self, costs: float, benefits: float, timeline: float) -> float:
         """Calculate Net Present Value"""
-        discount_rate = 0.1  # 10% discount rate
-        
-        npv = -costs  # Initial investment
-        annual_benefit = benefits / timeline
-        
-        for year in range(int(timeline)):
-            npv += annual_benefit / ((1 + discount_rate) ** (year + 1))
-        
-        return npv
+        return financial_scoring.npv_score(costs, benefits, timeline, discount_rate=0.1)
 
-    def _calculate_space_efficiency(self, space_reqs: Dict[str, int], staffing: Dict[str, int]) -> float:
+    def _calculate_space_efficiency(self, features: ProposalFeatures) -> float:
         """Calculate space utilization efficiency"""
-        total_space = sum(space_reqs.values())
-        total_staff = sum(staffing.values())
-        
-        if total_staff == 0:
-            return 0.5
-        
-        space_per_person = total_space / total_staff
-        target_space = 200  # Target sq ft per person
-        
-        return max(0, min(1, target_space / space_per_person))
+        return financial_scoring.space_efficiency_score(features.total_space, features.total_staff)
 
-    def _calculate_staff_efficiency(self, staffing: Dict[str, int]) -> float:
+    def _calculate_staff_efficiency(self, features: ProposalFeatures) -> float:
         """Calculate staff utilization efficiency"""
-        faculty = staffing.get('faculty', 0)
-        staff = staffing.get('staff', 0)
-        students = staffing.get('graduate_students', 0)
-        
-        if faculty == 0:
-            return 0.5
-        
-        support_ratio = (staff + students) / faculty
-        target_ratio = 5  # Target support staff per faculty
-        
-        return max(0, min(1, target_ratio / support_ratio)) 
+        return financial_scoring.staff_efficiency_score(
+            features.faculty, features.staffing.get('staff', 0), features.graduate_students
+        )
 
-    def _analyze_space_distribution(self, proposal: Dict[str, Any]) -> float:
+    def _analyze_space_distribution(self, features: ProposalFeatures) -> float:
         """Analyze space allocation distribution"""
-        space_reqs = proposal.get('space_requirements', {})
+        space_reqs = features.space_requirements
         if not space_reqs:
             return 0.5
         
         # Calculate distribution metrics
-        total_space = sum(space_reqs.values())
+        total_space = features.total_space
         if total_space == 0:
             return 0.5
         
-        # Analyze distribution ratios
-        ratios = {
-            'research': space_reqs.get('research_labs', 0) / total_space,
-            'office': space_reqs.get('offices', 0) / total_space,
-            'common': space_reqs.get('common_areas', 0) / total_space
-        }
-        
-        # Score based on ideal ratios
-        ideal_ratios = {'research': 0.5, 'office': 0.3, 'common': 0.2}
-        score = sum(
-            1 - abs(ratios[space_type] - ideal)
-            for space_type, ideal in ideal_ratios.items()
-        ) / len(ideal_ratios)
-        
-        return score
+        # Score against ideal shares of research, office and common space
+        return financial_scoring.allocation_balance_score(
+            space_reqs.get('research_labs', 0),
+            space_reqs.get('offices', 0),
+            space_reqs.get('common_areas', 0),
+            total_space,
+            0.5, 0.3, 0.2
+        )
 
-    def _analyze_staff_distribution(self, proposal: Dict[str, Any]) -> float:
+    def _analyze_staff_distribution(self, features: ProposalFeatures) -> float:
         """Analyze staff allocation distribution"""
-        staffing = proposal.get('staffing', {})
+        staffing = features.staffing
         if not staffing:
             return 0.5
         
-        total_staff = sum(staffing.values())
+        total_staff = features.total_staff
         if total_staff == 0:
             return 0.5
         
-        # Calculate staff ratios
-        ratios = {
-            'faculty': staffing.get('faculty', 0) / total_staff,
-            'staff': staffing.get('staff', 0) / total_staff,
-            'students': staffing.get('graduate_students', 0) / total_staff
-        }
-        
-        # Score based on ideal ratios
-        ideal_ratios = {'faculty': 0.3, 'staff': 0.3, 'students': 0.4}
-        score = sum(
-            1 - abs(ratios[staff_type] - ideal)
-            for staff_type, ideal in ideal_ratios.items()
-        ) / len(ideal_ratios)
-        
-        return score
+        # Score against ideal shares of faculty, staff and students
+        return financial_scoring.allocation_balance_score(
+            staffing.get('faculty', 0),
+            staffing.get('staff', 0),
+            staffing.get('graduate_students', 0),
+            total_staff,
+            0.3, 0.3, 0.4
+        )
 
-    def _analyze_budget_distribution(self, proposal: Dict[str, Any]) -> float:
+    def _analyze_budget_distribution(self, features: ProposalFeatures) -> float:
         """Analyze budget allocation distribution"""
-        budget = proposal.get('budget', 0)
-        if budget == 0:
+        if features.budget == 0:
             return 0.5
         
-        funding_sources = proposal.get('funding_sources', {})
+        funding_sources = features.funding_sources
         if not funding_sources:
             return 0.5
         
-        # Calculate funding diversity score
-        source_count = len(funding_sources)
-        max_sources = 4  # Expected maximum number of funding sources
-        diversity_score = min(source_count / max_sources, 1.0)
-        
-        # Calculate distribution balance
-        max_percentage = max(funding_sources.values())
-        min_percentage = min(funding_sources.values())
-        balance_score = 1 - (max_percentage - min_percentage)
-        
-        # Combine scores
-        return (diversity_score * 0.6 + balance_score * 0.4)
+        return financial_scoring.budget_distribution_score(
+            len(funding_sources), max(funding_sources.values()), min(funding_sources.values())
+        )
 
-    def _evaluate_long_term_viability(self, proposal: Dict[str, Any]) -> float:
+    def _evaluate_long_term_viability(self, features: ProposalFeatures) -> float:
         """Evaluate long-term financial viability"""
         # Calculate viability score based on multiple factors
         scores = [
-            self._assess_funding_stability(proposal),
-            self._evaluate_revenue_sustainability(proposal),
-            self._assess_cost_structure(proposal)
+            self._assess_funding_stability(features),
+            self._evaluate_revenue_sustainability(features),
+            self._assess_cost_structure(features)
         ]
         return sum(scores) / len(scores)
 
-    def _assess_revenue_potential(self, proposal: Dict[str, Any]) -> float:
+    def _assess_revenue_potential(self, features: ProposalFeatures) -> float:
         """Assess potential revenue generation"""
-        research_areas = len(proposal.get('research_areas', []))
-        funding_mix = len(proposal.get('funding_sources', {}))
+        research_areas = features.research_area_count
+        funding_mix = features.funding_source_count
         
         # Score based on revenue factors
         research_score = min(research_areas * 0.2, 1.0)
@@ -385,86 +369,42 @@ class FinancialAgent(BoardAgent):
         
         return (research_score + funding_score) / 2
 
-    def _identify_cost_reductions(self, proposal: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _identify_cost_reductions(self, features: ProposalFeatures) -> List[Dict[str, Any]]:
         """Identify potential cost reduction opportunities"""
-        opportunities = []
-        
-        # Space optimization opportunities
-        space_reqs = proposal.get('space_requirements', {})
-        if space_reqs:
-            opportunities.append({
-                'area': 'space',
-                'strategy': 'Shared facility usage',
-                'potential_savings': 0.15
-            })
-        
-        # Staffing optimization opportunities
-        staffing = proposal.get('staffing', {})
-        if staffing:
-            opportunities.append({
-                'area': 'staffing',
-                'strategy': 'Phased hiring approach',
-                'potential_savings': 0.20
-            })
-        
-        # Funding optimization opportunities
-        funding = proposal.get('funding_sources', {})
-        if funding:
-            opportunities.append({
-                'area': 'funding',
-                'strategy': 'Grant matching program',
-                'potential_savings': 0.10
-            })
-        
-        return opportunities
+        return [
+            dict(opportunity)
+            for feature, opportunity in COST_REDUCTIONS
+            if getattr(features, feature)
+        ]
 
-    def _evaluate_revenue_sustainability(self, proposal: Dict[str, Any]) -> float:
+    def _evaluate_revenue_sustainability(self, features: ProposalFeatures) -> float:
         """Evaluate sustainability of revenue streams"""
-        funding_sources = proposal.get('funding_sources', {})
+        funding_sources = features.funding_sources
         if not funding_sources:
             return 0.5
         
         # Calculate sustainability score based on funding mix
-        sustainability_weights = {
-            'university': 0.9,
-            'grants': 0.6,
-            'industry': 0.7,
-            'donations': 0.4
-        }
-        
         weighted_sum = sum(
-            percentage * sustainability_weights.get(source.lower(), 0.5)
-            for source, percentage in funding_sources.items()
+            share * FUNDING_SOURCE_WEIGHTS.get(source, DEFAULT_FUNDING_WEIGHTS)[1]
+            for source, share in features.funding_shares
         )
         
         return weighted_sum
 
-    def _assess_cost_structure(self, proposal: Dict[str, Any]) -> float:
+    def _assess_cost_structure(self, features: ProposalFeatures) -> float:
         """Assess the cost structure sustainability"""
-        budget = proposal.get('budget', 0)
-        if budget == 0:
+        if features.budget == 0:
             return 0.5
         
         # Calculate fixed vs variable costs ratio
-        fixed_costs = sum(proposal.get('space_requirements', {}).values()) * 100  # $100 per sq ft
+        fixed_costs = features.total_space * 100  # $100 per sq ft
         staff_costs = sum(
             count * self._get_annual_cost(role)
-            for role, count in proposal.get('staffing', {}).items()
+            for role, count in features.staffing.items()
         )
         
-        total_costs = fixed_costs + staff_costs
-        if total_costs == 0:
-            return 0.5
-        
-        fixed_ratio = fixed_costs / total_costs
-        # Prefer balanced cost structure (40-60% fixed costs)
-        return 1 - abs(fixed_ratio - 0.5)
+        return financial_scoring.cost_structure_score(fixed_costs, staff_costs)
 
     def _get_annual_cost(self, role: str) -> float:
         """Get annual cost for different roles"""
-        cost_map = {
-            'faculty': 120000,
-            'staff': 60000,
-            'graduate_students': 30000
-        }
-        return cost_map.get(role, 50000) 
\ No newline at end of file
+        return ANNUAL_STAFF_COSTS.get(role, 50000) 
\ No newline at end of file
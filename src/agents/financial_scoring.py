@@ -0,0 +1,69 @@
+"""Financial scores for NPV, overrun risk, space and staff efficiency, and budget and cost balance"""
+
+
+def npv_score(costs: float, benefits: float, timeline_years: float, discount_rate: float = 0.1) -> float:
+    """Net present value of the benefits spread evenly over the whole years, less the costs"""
+    annual_benefit = benefits / timeline_years
+    years = int(timeline_years)
+
+    # Present value of the annual benefit as an annuity
+    if discount_rate == 0:
+        annuity_factor = years
+    else:
+        annuity_factor = (1 - (1 + discount_rate) ** -years) / discount_rate
+
+    return -costs + annual_benefit * annuity_factor
+
+
+def overrun_risk_score(budget: float, timeline_years: float, research_area_count: int) -> float:
+    """Risk of budget overrun; higher budget, longer timeline and more complexity increase it"""
+    return (
+        0.3 * min(budget / 1000000, 1.0) +              # Budget factor
+        0.3 * min(timeline_years / 5, 1.0) +            # Timeline factor
+        0.4 * min(research_area_count / 5, 1.0)         # Complexity factor
+    )
+
+
+def space_efficiency_score(total_space: float, total_staff: int) -> float:
+    """Score space per person against a 200 sq ft target"""
+    if total_staff == 0:
+        return 0.5
+
+    space_per_person = total_space / total_staff
+    return max(0, min(1, 200 / space_per_person))
+
+
+def staff_efficiency_score(faculty: int, staff: int, graduate_students: int) -> float:
+    """Score support staff per faculty member against a target of five"""
+    if faculty == 0:
+        return 0.5
+
+    support_ratio = (staff + graduate_students) / faculty
+    return max(0, min(1, 5 / support_ratio))
+
+
+def allocation_balance_score(first: float, second: float, third: float, total: float,
+                             ideal_first: float, ideal_second: float, ideal_third: float) -> float:
+    """Average closeness of a three-way split to its ideal shares"""
+    return (
+        (1 - abs(first / total - ideal_first)) +
+        (1 - abs(second / total - ideal_second)) +
+        (1 - abs(third / total - ideal_third))
+    ) / 3
+
+
+def budget_distribution_score(source_count: int, max_share: float, min_share: float) -> float:
+    """Combine funding diversity (up to four sources) with how evenly the shares are spread"""
+    diversity_score = min(source_count / 4, 1.0)
+    balance_score = 1 - (max_share - min_share)
+    return diversity_score * 0.6 + balance_score * 0.4
+
+
+def cost_structure_score(fixed_costs: float, staff_costs: float) -> float:
+    """Score the fixed share of total costs, preferring a balanced 50% split"""
+    total_costs = fixed_costs + staff_costs
+    if total_costs == 0:
+        return 0.5
+
+    fixed_ratio = fixed_costs / total_costs
+    return 1 - abs(fixed_ratio - 0.5)
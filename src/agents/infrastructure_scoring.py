@@ -0,0 +1,39 @@
+"""Infrastructure sub-scores for sustainability, facilities and maintenance, and their weighted total"""
+
+
+def sustainability_score(energy_efficiency: float, mitigation_potential: float, carbon_footprint: float) -> float:
+    """Weighted energy efficiency, mitigation potential and carbon footprint against 1M tons (lower is better)"""
+    # 1M tons is a 50,000 sq ft building at 20 tons per sq ft, so the score still varies across realistic sizes
+    carbon_score = 1.0 - min(carbon_footprint / 1000000, 1.0)
+    return (
+        energy_efficiency * 0.4 +
+        mitigation_potential * 0.3 +
+        carbon_score * 0.3
+    )
+
+
+def facility_score(space_efficiency: float, renovation_cost: float, timeline_feasibility: float) -> float:
+    """Weighted space efficiency, renovation affordability against $5M and timeline feasibility"""
+    renovation_score = 1.0 - min(renovation_cost / 5000000, 1.0)
+    return (
+        space_efficiency * 0.3 +
+        renovation_score * 0.3 +
+        timeline_feasibility * 0.4
+    )
+
+
+def maintenance_score(total_annual_cost: float, total_staff: int) -> float:
+    """Weighted maintenance cost against $1M a year and staffing against ten people (lower is better)"""
+    cost_score = 1.0 - min(total_annual_cost / 1000000, 1.0)
+    staffing_score = 1.0 - min(total_staff / 10, 1.0)
+    return cost_score * 0.6 + staffing_score * 0.4
+
+
+def recommendation_score(space: float, facility: float, sustainability: float, maintenance: float) -> float:
+    """Combine the four sub-scores into the total the recommendation is drawn from"""
+    return (
+        space * 0.3 +
+        facility * 0.3 +
+        sustainability * 0.2 +
+        maintenance * 0.2
+    )
@@ -1,11 +1,12 @@
 from typing import Dict, List, Any
 from .base import BoardAgent
-import yaml
+from src.utils.prompt_config import load_role_config
 
 class LegalComplianceAgent(BoardAgent):
+    __slots__ = ('prompts', 'evaluation_criteria')
+    
     def __init__(self):
-        with open('src/prompts/legal_compliance.yaml', 'r') as file:
-            config = yaml.safe_load(file)
+        config = load_role_config('src/prompts/legal_compliance.yaml')
             
         super().__init__(
             role="Legal Compliance Officer",
@@ -28,9 +29,10 @@ class LegalComplianceAgent(BoardAgent):
         """Generate compliance-focused feedback"""
         return self._generate_structured_feedback(context)
         
-    def vote(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
-        """Cast vote with legal compliance rationale"""
-        evaluation = self.evaluate_proposal(proposal)
+    def vote(self, proposal: Dict[str, Any], evaluation: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Cast vote with legal compliance rationale, reusing an evaluation already made for the proposal"""
+        if evaluation is None:
+            evaluation = self.evaluate_proposal(proposal)
         vote_decision = self._make_vote_decision(evaluation)
         return {
             'vote': vote_decision['vote'],
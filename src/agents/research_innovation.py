@@ -1,17 +1,214 @@
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Mapping, Tuple
+from functools import lru_cache
+from operator import itemgetter, mul
+from types import MappingProxyType
+import numpy as np
+from src.agents import research_scoring
 from src.agents.base import BoardAgent
-import yaml
+from src.ai.claude_integration import ClaudeAI
+from src.agents.features import ProposalFeatures
+from src.utils.prompt_config import load_role_config
 from src.utils.logging import setup_logger
 
+# Weight of each assessment component in the research and innovation scores
+RESEARCH_WEIGHTS = MappingProxyType({
+    'research_alignment': 0.3,
+    'funding_potential': 0.3,
+    'publication_potential': 0.2,
+    'research_infrastructure': 0.2
+})
+INNOVATION_WEIGHTS = MappingProxyType({
+    'innovation_level': 0.3,
+    'market_relevance': 0.2,
+    'technology_advancement': 0.3,
+    'commercialization_potential': 0.2
+})
+# Fetch an assessment's weighted components in table order
+RESEARCH_COMPONENTS = itemgetter(*RESEARCH_WEIGHTS)
+INNOVATION_COMPONENTS = itemgetter(*INNOVATION_WEIGHTS)
+# Weight of each evaluation aspect in the vote
+VOTE_WEIGHTS = MappingProxyType({
+    'research_potential': 0.3,
+    'innovation_impact': 0.3,
+    'collaboration_opportunities': 0.2,
+    'knowledge_transfer': 0.2
+})
+# The research and innovation weights as vectors, in table order, for scoring many evaluations at once
+RESEARCH_WEIGHT_VECTOR = np.array(list(RESEARCH_WEIGHTS.values()))
+INNOVATION_WEIGHT_VECTOR = np.array(list(INNOVATION_WEIGHTS.values()))
+
+# Score of each keyword a research area may mention, one table per assessment
+TECH_ADVANCEMENT_SCORES = MappingProxyType({
+    'ai': 0.9,
+    'machine learning': 0.85,
+    'ethics': 0.7,
+    'innovation': 0.8,
+    'security': 0.75,
+    'privacy': 0.75,
+    'computing': 0.8,
+    'technology': 0.7
+})
+COMMERCIALIZATION_SCORES = MappingProxyType({
+    'ai': 0.9,
+    'technology': 0.8,
+    'innovation': 0.85,
+    'application': 0.8,
+    'security': 0.75,
+    'computing': 0.8,
+    'ethics': 0.6  # Lower but still valuable for consulting/policy
+})
+TECH_TRANSFER_SCORES = MappingProxyType({
+    'ai': 0.9,
+    'technology': 0.85,
+    'application': 0.8,
+    'computing': 0.8,
+    'security': 0.75,
+    'innovation': 0.85
+})
+INDUSTRY_APPLICATION_SCORES = MappingProxyType({
+    'application': 1.0,
+    'industry': 0.9,
+    'practical': 0.8,
+    'implementation': 0.8,
+    'solution': 0.7
+})
+SOCIETAL_IMPACT_SCORES = MappingProxyType({
+    'ethics': 1.0,
+    'social': 0.9,
+    'policy': 0.8,
+    'public': 0.8,
+    'impact': 0.7
+})
+
+# Strategic research priorities by department, lowercased for matching
+DEPARTMENT_PRIORITIES = MappingProxyType({
+    department: tuple(priority.lower() for priority in priorities)
+    for department, priorities in {
+        'Computer Science': (
+            'AI Ethics', 'Machine Learning', 'Cybersecurity',
+            'Data Science', 'Software Engineering'
+        ),
+        'Engineering': (
+            'Robotics', 'Sustainable Energy', 'Materials Science',
+            'Bioengineering', 'Smart Systems'
+        ),
+        'Business': (
+            'Digital Innovation', 'Entrepreneurship', 'Sustainable Business',
+            'Finance Technology', 'Management Analytics'
+        )
+    }.items()
+})
+
+
+@lru_cache(maxsize=4096)
+def _strategic_alignment(department: str, research_areas: Tuple[str, ...]) -> float:
+    """Share of a department's strategic priorities the research areas match"""
+    dept_priorities = DEPARTMENT_PRIORITIES.get(department)
+    if not dept_priorities:
+        return 0.5  # Default alignment if department not found
+    
+    matching_areas = 0
+    for area in research_areas:
+        area = area.lower()
+        if any(area in priority or priority in area for priority in dept_priorities):
+            matching_areas += 1
+    
+    return min(matching_areas / len(dept_priorities), 1.0)
+
+# Keywords that place a research area in a discipline category
+DISCIPLINE_KEYWORDS = MappingProxyType({
+    'technical': ('ai', 'computing', 'technology', 'data'),
+    'social': ('ethics', 'policy', 'social', 'impact'),
+    'business': ('innovation', 'market', 'industry'),
+    'legal': ('compliance', 'regulation', 'privacy')
+})
+
+# Grant programs, each opened by a research area containing one of its (case-sensitive) keywords; no keywords means always open
+GRANT_PROGRAMS = (
+    # Government grants
+    (('AI', 'Ethics'), MappingProxyType({
+        'source': 'NSF',
+        'program': 'AI Research Initiatives',
+        'potential_amount': 2000000,
+        'probability': 0.7
+    })),
+    # Industry partnerships
+    (('Innovation', 'Technology'), MappingProxyType({
+        'source': 'Industry Partners',
+        'program': 'Tech Innovation Fund',
+        'potential_amount': 1000000,
+        'probability': 0.8
+    })),
+    # Academic collaborations
+    ((), MappingProxyType({
+        'source': 'Inter-University Network',
+        'program': 'Collaborative Research Grant',
+        'potential_amount': 500000,
+        'probability': 0.6
+    }))
+)
+# Expected funding of each grant program, in the same order
+GRANT_EXPECTED_FUNDING = tuple(
+    program['potential_amount'] * program['probability'] for _, program in GRANT_PROGRAMS
+)
+
+# Industry funding is given as a share; partnerships report it as an amount on this scale
+INDUSTRY_FUNDING_AMOUNT = 1000000
+# Industry funding share counts double as a sign of commercial interest
+INDUSTRY_FUNDING_WEIGHT = 2
+
+# Industry sectors interested in AI ethics, keyed by the keyword that signals them
+INDUSTRY_SECTORS = MappingProxyType({
+    'ai': MappingProxyType({
+        'sector': 'Tech Companies',
+        'interest_level': 0.9,
+        'potential_partners': ('Major Tech Firms', 'AI Startups'),
+        'collaboration_areas': ('AI Ethics Guidelines', 'Bias Detection')
+    }),
+    'ethics': MappingProxyType({
+        'sector': 'Consulting',
+        'interest_level': 0.8,
+        'potential_partners': ('Ethics Consultancies', 'Policy Think Tanks'),
+        'collaboration_areas': ('Policy Development', 'Ethics Training')
+    }),
+    'security': MappingProxyType({
+        'sector': 'Cybersecurity',
+        'interest_level': 0.85,
+        'potential_partners': ('Security Firms', 'Financial Institutions'),
+        'collaboration_areas': ('Security Protocols', 'Risk Assessment')
+    }),
+    'privacy': MappingProxyType({
+        'sector': 'Data Protection',
+        'interest_level': 0.85,
+        'potential_partners': ('Privacy Tech Companies', 'Legal Tech Firms'),
+        'collaboration_areas': ('Privacy Tools', 'Compliance Solutions')
+    })
+})
+
+# Academic disciplines relevant to AI ethics, keyed by the keyword that signals them
+ACADEMIC_FIELDS = MappingProxyType({
+    'ai': ('Computer Science', 'Data Science', 'Robotics'),
+    'ethics': ('Philosophy', 'Law', 'Social Sciences'),
+    'policy': ('Public Policy', 'Government', 'International Relations'),
+    'security': ('Information Security', 'Risk Management'),
+    'privacy': ('Law', 'Information Systems', 'Digital Rights')
+})
+
+
+class _NumericScores(dict):
+    """Assessment whose values are all plain numbers, so normalizing it is a straight average"""
+    __slots__ = ()
+
+
 class ResearchInnovationAgent(BoardAgent):
-    def __init__(self, config: Dict[str, Any]):
-        with open('src/prompts/research_innovation.yaml', 'r') as file:
-            role_config = yaml.safe_load(file)
+    def __init__(self, config: Dict[str, Any], ai: ClaudeAI = None):
+        role_config = load_role_config('src/prompts/research_innovation.yaml')
         
         super().__init__(
             role="Research and Innovation Officer",
             priorities=role_config['priorities'],
-            config=config
+            config=config,
+            ai=ai
         )
         self.prompts = role_config['prompts']
         self.evaluation_criteria = role_config['evaluation_criteria']
@@ -19,12 +216,20 @@ class ResearchInnovationAgent(BoardAgent):
     
     async def evaluate_proposal(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate proposals with focus on research and innovation impact"""
+        # vote re-evaluates the proposal the board has just evaluated
+        return await self._memoized_evaluation(proposal, self._evaluate_proposal)
+
+    async def _evaluate_proposal(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
+        """Score every research and innovation aspect of a proposal"""
+        # Every assessment is local computation, so nothing here awaits
         try:
+            # Derived proposal quantities, such as the lowercased research areas, are shared by every assessment
+            features = ProposalFeatures(proposal)
             evaluation = {
-                'research_potential': await self._assess_research_potential(proposal),
-                'innovation_impact': await self._assess_innovation_impact(proposal),
-                'collaboration_opportunities': await self._assess_collaboration_opportunities(proposal),
-                'knowledge_transfer': await self._assess_knowledge_transfer(proposal)
+                'research_potential': self._assess_research_potential(features),
+                'innovation_impact': self._assess_innovation_impact(features),
+                'collaboration_opportunities': self._assess_collaboration_opportunities(features),
+                'knowledge_transfer': self._assess_knowledge_transfer(features)
             }
             evaluation['overall_recommendation'] = self._generate_recommendation(evaluation)
             return evaluation
@@ -35,56 +240,56 @@ class ResearchInnovationAgent(BoardAgent):
                 'error': str(e)
             }
 
-    async def _assess_research_potential(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_research_potential(self, features: ProposalFeatures) -> Dict[str, Any]:
         """Assess research potential and impact"""
         return {
-            'research_alignment': self._evaluate_research_alignment(proposal),
-            'funding_potential': await self._evaluate_grant_potential(proposal),
-            'publication_potential': self._estimate_publication_potential(proposal),
-            'research_infrastructure': self._assess_research_infrastructure(proposal)
+            'research_alignment': self._evaluate_research_alignment(features),
+            'funding_potential': self._evaluate_grant_potential(features),
+            'publication_potential': self._estimate_publication_potential(features),
+            'research_infrastructure': self._assess_research_infrastructure(features)
         }
     
-    async def _assess_innovation_impact(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_innovation_impact(self, features: ProposalFeatures) -> Dict[str, Any]:
         """Assess innovation and technological impact"""
         return {
-            'innovation_level': self._evaluate_innovation_level(proposal),
-            'market_relevance': self._assess_market_relevance(proposal),
-            'technology_advancement': self._evaluate_tech_advancement(proposal),
-            'commercialization_potential': self._assess_commercialization(proposal)
+            'innovation_level': self._evaluate_innovation_level(features),
+            'market_relevance': self._assess_market_relevance(features),
+            'technology_advancement': self._evaluate_tech_advancement(features),
+            'commercialization_potential': self._assess_commercialization(features)
         }
     
-    async def _assess_collaboration_opportunities(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_collaboration_opportunities(self, features: ProposalFeatures) -> Dict[str, Any]:
         """Assess potential collaborations and partnerships"""
+        # Network growth is measured from the same partner lists
+        industry_partners = self._identify_industry_partners(features)
+        academic_collabs = self._identify_academic_collaborations(features)
         return {
-            'industry_partnerships': self._identify_industry_partners(proposal),
-            'academic_collaborations': self._identify_academic_collaborations(proposal),
-            'interdisciplinary_potential': self._evaluate_interdisciplinary_scope(proposal),
-            'network_expansion': self._assess_network_growth(proposal)
+            'industry_partnerships': industry_partners,
+            'academic_collaborations': academic_collabs,
+            'interdisciplinary_potential': self._evaluate_interdisciplinary_scope(features),
+            'network_expansion': self._assess_network_growth(industry_partners, academic_collabs)
         }
     
-    async def _assess_knowledge_transfer(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_knowledge_transfer(self, features: ProposalFeatures) -> Dict[str, Any]:
         """Assess knowledge transfer and application potential"""
         return {
-            'technology_transfer': self._evaluate_tech_transfer(proposal),
-            'industry_application': self._assess_industry_application(proposal),
-            'societal_impact': self._evaluate_societal_impact(proposal),
-            'educational_benefits': self._assess_educational_benefits(proposal)
+            'technology_transfer': self._evaluate_tech_transfer(features),
+            'industry_application': self._assess_industry_application(features),
+            'societal_impact': self._evaluate_societal_impact(features),
+            'educational_benefits': self._assess_educational_benefits(features)
         }
     
-    def _evaluate_research_alignment(self, proposal: Dict[str, Any]) -> float:
+    def _evaluate_research_alignment(self, features: ProposalFeatures) -> float:
         """Evaluate alignment with university research priorities"""
-        department = proposal.get('department', '')
-        research_areas = proposal.get('research_areas', [])
-        strategic_alignment = self._calculate_strategic_alignment(department, research_areas)
-        return strategic_alignment
+        return self._calculate_strategic_alignment(features.department, features.research_areas)
     
-    async def _evaluate_grant_potential(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
+    def _evaluate_grant_potential(self, features: ProposalFeatures) -> Dict[str, Any]:
         """Evaluate potential for securing research grants"""
         try:
-            funding_sources = proposal.get('funding_sources', {})
-            opportunities = self._identify_grant_opportunities(proposal)
-            success_prob = self._estimate_grant_success(proposal)
-            potential_funding = self._estimate_potential_funding(proposal)
+            programs = self._open_grant_programs(features)
+            opportunities = self._identify_grant_opportunities(programs)
+            success_prob = self._estimate_grant_success(features)
+            potential_funding = self._estimate_potential_funding(programs)
             
             return {
                 'grant_opportunities': opportunities,
@@ -122,58 +327,75 @@ class ResearchInnovationAgent(BoardAgent):
     
     def _calculate_research_score(self, research_potential: Dict[str, Any]) -> float:
         """Calculate overall research potential score"""
-        weights = {
-            'research_alignment': 0.3,
-            'funding_potential': 0.3,
-            'publication_potential': 0.2,
-            'research_infrastructure': 0.2
-        }
-        
-        return sum(
-            weights[key] * self._normalize_score(value)
-            for key, value in research_potential.items()
-            if key in weights
-        )
+        components = map(self._normalize_score, RESEARCH_COMPONENTS(research_potential))
+        return sum(map(mul, RESEARCH_WEIGHTS.values(), components))
     
     def _calculate_innovation_score(self, innovation_impact: Dict[str, Any]) -> float:
         """Calculate overall innovation impact score"""
-        weights = {
-            'innovation_level': 0.3,
-            'market_relevance': 0.2,
-            'technology_advancement': 0.3,
-            'commercialization_potential': 0.2
-        }
-        
-        return sum(
-            weights[key] * self._normalize_score(value)
-            for key, value in innovation_impact.items()
-            if key in weights
-        )
+        components = map(self._normalize_score, INNOVATION_COMPONENTS(innovation_impact))
+        return sum(map(mul, INNOVATION_WEIGHTS.values(), components))
+    
+    def score_evaluations(self, evaluations: List[Dict[str, Any]]) -> np.ndarray:
+        """Research and innovation scores of many evaluations at once, one (research, innovation) row each"""
+        research = np.array([
+            list(map(self._normalize_score, RESEARCH_COMPONENTS(evaluation['research_potential'])))
+            for evaluation in evaluations
+        ], dtype=float).reshape(len(evaluations), len(RESEARCH_WEIGHTS))
+        innovation = np.array([
+            list(map(self._normalize_score, INNOVATION_COMPONENTS(evaluation['innovation_impact'])))
+            for evaluation in evaluations
+        ], dtype=float).reshape(len(evaluations), len(INNOVATION_WEIGHTS))
+        
+        return np.column_stack((research @ RESEARCH_WEIGHT_VECTOR, innovation @ INNOVATION_WEIGHT_VECTOR))
     
     def _normalize_score(self, value: Any) -> float:
         """Normalize various score types to 0-1 range"""
         try:
-            if isinstance(value, dict):
-                # Handle dictionary values that might be lists or numbers
-                scores = []
-                for v in value.values():
-                    if isinstance(v, (int, float)):
-                        scores.append(v)
-                    elif isinstance(v, list):
-                        scores.extend([x for x in v if isinstance(x, (int, float))])
-                    elif isinstance(v, dict):
-                        scores.append(self._normalize_score(v))
-                return sum(scores) / len(scores) if scores else 0.5
+            # Plain numbers are the common case
+            value_type = type(value)
+            if value_type is float or value_type is int:
+                return min(max(value, 0), 1)
+            elif value_type is _NumericScores and value:
+                return sum(value.values()) / len(value)
+            elif isinstance(value, dict):
+                # Walk nested dicts with an explicit stack; each nested dict counts as one score, its own average
+                stack = [[iter(value.values()), 0, 0]]
+                while True:
+                    frame = stack[-1]
+                    for v in frame[0]:
+                        if isinstance(v, (int, float)):
+                            frame[1] += v
+                            frame[2] += 1
+                        elif isinstance(v, list):
+                            for x in v:
+                                if isinstance(x, (int, float)):
+                                    frame[1] += x
+                                    frame[2] += 1
+                        elif isinstance(v, dict):
+                            stack.append([iter(v.values()), 0, 0])
+                            break
+                    else:
+                        stack.pop()
+                        score = frame[1] / frame[2] if frame[2] else 0.5
+                        if not stack:
+                            return score
+                        stack[-1][1] += score
+                        stack[-1][2] += 1
             elif isinstance(value, (int, float)):
                 return min(max(value, 0), 1)
             elif isinstance(value, list):
                 # Handle list values
-                scores = [x for x in value if isinstance(x, (int, float))]
-                return sum(scores) / len(scores) if scores else 0.5
+                total = 0
+                count = 0
+                for x in value:
+                    if isinstance(x, (int, float)):
+                        total += x
+                        count += 1
+                return total / count if count else 0.5
             else:
                 return 0.5  # Default for unhandled types
         except Exception as e:
-            print(f"Warning: Error normalizing score: {e}")
+            self.logger.warning("Error normalizing score: %s", e)
             return 0.5
         
     async def generate_feedback(self, context: Dict[str, Any]) -> str:
@@ -191,78 +413,28 @@ class ResearchInnovationAgent(BoardAgent):
 
     def _calculate_strategic_alignment(self, department: str, research_areas: List[str]) -> float:
         """Calculate alignment with strategic research priorities"""
-        # Define strategic research priorities by department
-        department_priorities = {
-            'Computer Science': [
-                'AI Ethics', 'Machine Learning', 'Cybersecurity',
-                'Data Science', 'Software Engineering'
-            ],
-            'Engineering': [
-                'Robotics', 'Sustainable Energy', 'Materials Science',
-                'Bioengineering', 'Smart Systems'
-            ],
-            'Business': [
-                'Digital Innovation', 'Entrepreneurship', 'Sustainable Business',
-                'Finance Technology', 'Management Analytics'
-            ]
-        }
-        
-        # Get priorities for the department
-        dept_priorities = department_priorities.get(department, [])
-        if not dept_priorities:
-            return 0.5  # Default alignment if department not found
-        
-        # Calculate alignment score
-        matching_areas = sum(
-            any(area.lower() in priority.lower() or priority.lower() in area.lower()
-                for priority in dept_priorities)
-            for area in research_areas
-        )
-        
-        return min(matching_areas / len(dept_priorities), 1.0)
+        # Cached on the department and areas, so repeated evaluations skip the matching
+        return _strategic_alignment(department, tuple(research_areas))
 
-    def _identify_grant_opportunities(self, proposal: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _open_grant_programs(self, features: ProposalFeatures) -> List[int]:
+        """Indexes into GRANT_PROGRAMS of the programs the research areas qualify for"""
+        research_areas = features.research_areas
+        return [
+            index for index, (keywords, _) in enumerate(GRANT_PROGRAMS)
+            if not keywords or any(keyword in area for area in research_areas for keyword in keywords)
+        ]
+
+    def _identify_grant_opportunities(self, programs: List[int]) -> List[Dict[str, Any]]:
         """Identify potential grant opportunities"""
-        research_areas = proposal.get('research_areas', [])
-        department = proposal.get('department', '')
-        
-        opportunities = []
-        
-        # Government grants
-        if any('AI' in area or 'Ethics' in area for area in research_areas):
-            opportunities.append({
-                'source': 'NSF',
-                'program': 'AI Research Initiatives',
-                'potential_amount': 2000000,
-                'probability': 0.7
-            })
-        
-        # Industry partnerships
-        if any('Innovation' in area or 'Technology' in area for area in research_areas):
-            opportunities.append({
-                'source': 'Industry Partners',
-                'program': 'Tech Innovation Fund',
-                'potential_amount': 1000000,
-                'probability': 0.8
-            })
-        
-        # Academic collaborations
-        opportunities.append({
-            'source': 'Inter-University Network',
-            'program': 'Collaborative Research Grant',
-            'potential_amount': 500000,
-            'probability': 0.6
-        })
-        
-        return opportunities
+        return [dict(GRANT_PROGRAMS[index][1]) for index in programs]
 
-    def _estimate_grant_success(self, proposal: Dict[str, Any]) -> float:
+    def _estimate_grant_success(self, features: ProposalFeatures) -> float:
         """Estimate probability of securing grants"""
         factors = {
-            'research_strength': self._evaluate_research_strength(proposal),
-            'team_expertise': self._evaluate_team_expertise(proposal),
-            'innovation_level': self._evaluate_innovation_level(proposal),
-            'infrastructure': self._evaluate_infrastructure_readiness(proposal)
+            'research_strength': self._evaluate_research_strength(features),
+            'team_expertise': self._evaluate_team_expertise(features),
+            'innovation_level': self._evaluate_innovation_level(features),
+            'infrastructure': self._evaluate_infrastructure_readiness(features)
         }
         
         weights = {
@@ -274,192 +446,126 @@ class ResearchInnovationAgent(BoardAgent):
         
         return sum(score * weights[factor] for factor, score in factors.items())
 
-    def _evaluate_research_strength(self, proposal: Dict[str, Any]) -> float:
+    def _evaluate_research_strength(self, features: ProposalFeatures) -> float:
         """Evaluate strength of research proposal"""
-        research_areas = proposal.get('research_areas', [])
-        faculty = proposal.get('staffing', {}).get('faculty', 0)
-        
         # Score based on research breadth and faculty strength
-        research_breadth = min(len(research_areas) * 0.2, 1.0)
-        faculty_strength = min(faculty * 0.1, 1.0)
+        research_breadth = min(features.research_area_count * 0.2, 1.0)
+        faculty_strength = min(features.faculty * 0.1, 1.0)
         
         return (research_breadth + faculty_strength) / 2
 
-    def _evaluate_team_expertise(self, proposal: Dict[str, Any]) -> float:
+    def _evaluate_team_expertise(self, features: ProposalFeatures) -> float:
         """Evaluate research team expertise"""
-        faculty = proposal.get('staffing', {}).get('faculty', 0)
-        staff = proposal.get('staffing', {}).get('staff', 0)
-        students = proposal.get('staffing', {}).get('graduate_students', 0)
-        
-        # Calculate team composition score
-        team_size = faculty + staff + students
-        if team_size == 0:
-            return 0.5
-        
-        faculty_ratio = faculty / team_size
-        return min(faculty_ratio + 0.3, 1.0)  # Value faculty presence but cap the score
+        return research_scoring.team_expertise_score(features.faculty, features.team_size)
 
-    def _evaluate_innovation_level(self, proposal: Dict[str, Any]) -> float:
+    def _evaluate_innovation_level(self, features: ProposalFeatures) -> float:
         """Evaluate innovation potential"""
-        research_areas = proposal.get('research_areas', [])
-        funding_mix = len(proposal.get('funding_sources', {}))
-        
         # Innovation factors
-        research_novelty = min(len(research_areas) * 0.15, 0.6)
-        funding_diversity = min(funding_mix * 0.1, 0.4)
+        research_novelty = min(features.research_area_count * 0.15, 0.6)
+        funding_diversity = min(features.funding_source_count * 0.1, 0.4)
         
         return research_novelty + funding_diversity
 
-    def _evaluate_infrastructure_readiness(self, proposal: Dict[str, Any]) -> float:
+    def _evaluate_infrastructure_readiness(self, features: ProposalFeatures) -> float:
         """Evaluate infrastructure readiness"""
-        space_reqs = proposal.get('space_requirements', {})
-        
-        # Calculate space readiness
-        research_space = space_reqs.get('research_labs', 0)
-        total_space = sum(space_reqs.values())
-        
+        total_space = features.total_space
         if total_space == 0:
             return 0.5
         
-        return min(research_space / total_space + 0.3, 1.0)
+        return min(features.lab_space / total_space + 0.3, 1.0)
 
-    def _estimate_potential_funding(self, proposal: Dict[str, Any]) -> float:
-        """Estimate potential funding amount"""
-        base_budget = proposal.get('budget', 0)
-        opportunities = self._identify_grant_opportunities(proposal)
-        
-        potential_funding = sum(
-            opp['potential_amount'] * opp['probability']
-            for opp in opportunities
-        )
-        
-        return potential_funding 
+    def _estimate_potential_funding(self, programs: List[int]) -> float:
+        """Estimate potential funding amount from the open grant programs"""
+        return sum(GRANT_EXPECTED_FUNDING[index] for index in programs)
 
-    def _estimate_publication_potential(self, proposal: Dict[str, Any]) -> Dict[str, float]:
+    def _estimate_publication_potential(self, features: ProposalFeatures) -> Dict[str, float]:
         """Estimate potential for academic publications"""
-        research_areas = proposal.get('research_areas', [])
-        faculty = proposal.get('staffing', {}).get('faculty', 0)
-        grad_students = proposal.get('staffing', {}).get('graduate_students', 0)
-        
         # Calculate potential based on team size and research areas
-        team_size_score = min((faculty + grad_students * 0.5) / 10, 1.0)
-        research_breadth = min(len(research_areas) * 0.2, 1.0)
+        team_size_score = min((features.faculty + features.graduate_students * 0.5) / 10, 1.0)
+        research_breadth = min(features.research_area_count * 0.2, 1.0)
         
-        return {
+        return _NumericScores({
             'annual_publications': team_size_score * 5,  # Estimated publications per year
             'quality_score': research_breadth * 0.8,     # Estimated publication quality
             'impact_potential': (team_size_score + research_breadth) / 2
-        } 
+        })
 
-    def _assess_research_infrastructure(self, proposal: Dict[str, Any]) -> Dict[str, float]:
+    def _assess_research_infrastructure(self, features: ProposalFeatures) -> Dict[str, float]:
         """Assess research infrastructure requirements and readiness"""
-        space_reqs = proposal.get('space_requirements', {})
-        
-        # Calculate infrastructure metrics
-        research_space = space_reqs.get('research_labs', 0)
-        total_space = sum(space_reqs.values())
+        total_space = features.total_space
         
         # Calculate space allocation score
-        space_score = research_space / total_space if total_space > 0 else 0.5
+        space_score = features.lab_space / total_space if total_space > 0 else 0.5
         
         # Assess equipment and facilities
-        equipment_score = self._assess_equipment_needs(proposal)
-        facility_score = self._assess_facility_readiness(proposal)
+        equipment_score = self._assess_equipment_needs(features)
+        facility_score = self._assess_facility_readiness(features)
         
-        return {
+        return _NumericScores({
             'space_adequacy': space_score,
             'equipment_readiness': equipment_score,
             'facility_readiness': facility_score,
             'overall_readiness': (space_score + equipment_score + facility_score) / 3
-        }
+        })
 
-    def _assess_equipment_needs(self, proposal: Dict[str, Any]) -> float:
+    def _assess_equipment_needs(self, features: ProposalFeatures) -> float:
         """Assess research equipment requirements"""
-        research_areas = proposal.get('research_areas', [])
-        
         # Base score on research complexity
-        base_score = min(len(research_areas) * 0.2, 0.8)
+        base_score = min(features.research_area_count * 0.2, 0.8)
         
         # Add bonus for technical areas
         tech_bonus = 0.2 if any(
-            area.lower() in ['ai', 'machine learning', 'computing']
-            for area in research_areas
+            area in ['ai', 'machine learning', 'computing']
+            for area in features.research_areas_lower
         ) else 0
         
         return min(base_score + tech_bonus, 1.0)
 
-    def _assess_facility_readiness(self, proposal: Dict[str, Any]) -> float:
+    def _assess_facility_readiness(self, features: ProposalFeatures) -> float:
         """Assess facility readiness for research activities"""
-        space_reqs = proposal.get('space_requirements', {})
-        
-        # Calculate readiness based on space distribution
-        lab_space = space_reqs.get('research_labs', 0)
-        office_space = space_reqs.get('offices', 0)
-        common_space = space_reqs.get('common_areas', 0)
-        
-        total_space = lab_space + office_space + common_space
-        if total_space == 0:
-            return 0.5
-        
-        # Ideal ratios: 50% labs, 30% offices, 20% common areas
-        lab_ratio = lab_space / total_space
-        office_ratio = office_space / total_space
-        common_ratio = common_space / total_space
-        
-        # Calculate deviation from ideal ratios
-        deviation = (
-            abs(lab_ratio - 0.5) +
-            abs(office_ratio - 0.3) +
-            abs(common_ratio - 0.2)
-        ) / 3
-        
-        return 1.0 - deviation 
+        return research_scoring.facility_readiness_score(
+            features.lab_space,
+            features.office_space,
+            features.common_space
+        )
 
-    def _assess_market_relevance(self, proposal: Dict[str, Any]) -> float:
+    def _assess_market_relevance(self, features: ProposalFeatures) -> float:
         """Assess market relevance and potential commercial impact"""
-        research_areas = proposal.get('research_areas', [])
-        funding_sources = proposal.get('funding_sources', {})
-        
         # Calculate market relevance score
-        industry_funding = funding_sources.get('industry', 0)
         market_oriented_areas = sum(
-            1 for area in research_areas
-            if any(term in area.lower() for term in 
+            1 for area in features.research_areas_lower
+            if any(term in area for term in 
                   ['ai', 'ethics', 'innovation', 'technology', 'application'])
         )
         
         # Combine factors
-        industry_score = industry_funding * 2  # Weight industry funding
+        industry_score = features.industry_funding * INDUSTRY_FUNDING_WEIGHT
         area_score = min(market_oriented_areas * 0.2, 0.8)  # Cap area score
         
         return min((industry_score + area_score) / 2, 1.0) 
 
-    def _evaluate_tech_advancement(self, proposal: Dict[str, Any]) -> float:
+    def _industry_interest(self, features: ProposalFeatures) -> float:
+        """Commercial interest signalled by the industry funding share, capped at 1"""
+        return min(features.industry_funding * INDUSTRY_FUNDING_WEIGHT, 1.0)
+
+    def _keyword_area_scores(self, areas_lower: Tuple[str, ...], keyword_scores: Mapping[str, float]) -> List[float]:
+        """Best keyword score of each lowercased research area that mentions any of the keywords"""
+        area_scores = []
+        for area in areas_lower:
+            best = max(
+                (score for keyword, score in keyword_scores.items() if keyword in area),
+                default=None
+            )
+            if best is not None:
+                area_scores.append(best)
+        return area_scores
+
+    def _evaluate_tech_advancement(self, features: ProposalFeatures) -> float:
         """Evaluate technological advancement potential"""
-        research_areas = proposal.get('research_areas', [])
-        
-        # Define tech advancement indicators
-        tech_indicators = {
-            'ai': 0.9,
-            'machine learning': 0.85,
-            'ethics': 0.7,
-            'innovation': 0.8,
-            'security': 0.75,
-            'privacy': 0.75,
-            'computing': 0.8,
-            'technology': 0.7
-        }
+        areas_lower = features.research_areas_lower
         
         # Calculate advancement score based on research areas
-        advancement_scores = []
-        for area in research_areas:
-            area_lower = area.lower()
-            matching_scores = [
-                score for keyword, score in tech_indicators.items()
-                if keyword in area_lower
-            ]
-            if matching_scores:
-                advancement_scores.append(max(matching_scores))
+        advancement_scores = self._keyword_area_scores(areas_lower, TECH_ADVANCEMENT_SCORES)
         
         # Calculate final score
         if not advancement_scores:
@@ -469,49 +575,26 @@ class ResearchInnovationAgent(BoardAgent):
         
         # Add bonus for interdisciplinary tech research
         unique_tech_areas = len(set(
-            keyword for keyword in tech_indicators.keys()
-            for area in research_areas
-            if keyword in area.lower()
+            keyword for keyword in TECH_ADVANCEMENT_SCORES
+            for area in areas_lower
+            if keyword in area
         ))
         interdisciplinary_bonus = min(unique_tech_areas * 0.1, 0.2)
         
-        return min(base_score + interdisciplinary_bonus, 1.0) 
+        return min(base_score + interdisciplinary_bonus, 1.0)
 
-    def _assess_commercialization(self, proposal: Dict[str, Any]) -> float:
+    def _assess_commercialization(self, features: ProposalFeatures) -> float:
         """Assess potential for commercialization of research outcomes"""
-        research_areas = proposal.get('research_areas', [])
-        funding_sources = proposal.get('funding_sources', {})
-        
-        # Factors that indicate commercialization potential
-        commercial_indicators = {
-            'ai': 0.9,
-            'technology': 0.8,
-            'innovation': 0.85,
-            'application': 0.8,
-            'security': 0.75,
-            'computing': 0.8,
-            'ethics': 0.6  # Lower but still valuable for consulting/policy
-        }
-        
         # Calculate base commercialization score from research areas
-        area_scores = []
-        for area in research_areas:
-            area_lower = area.lower()
-            matching_scores = [
-                score for keyword, score in commercial_indicators.items()
-                if keyword in area_lower
-            ]
-            if matching_scores:
-                area_scores.append(max(matching_scores))
+        area_scores = self._keyword_area_scores(features.research_areas_lower, COMMERCIALIZATION_SCORES)
         
         base_score = sum(area_scores) / len(area_scores) if area_scores else 0.5
         
         # Industry funding indicates commercial interest
-        industry_funding = funding_sources.get('industry', 0)
-        funding_score = min(industry_funding * 2, 1.0)  # Double industry funding percentage
+        funding_score = self._industry_interest(features)
         
         # Consider team composition
-        team_score = self._assess_commercialization_team_strength(proposal)
+        team_score = self._assess_commercialization_team_strength(features)
         
         # Weight the factors
         weighted_score = (
@@ -522,142 +605,85 @@ class ResearchInnovationAgent(BoardAgent):
         
         return min(weighted_score, 1.0)
 
-    def _assess_commercialization_team_strength(self, proposal: Dict[str, Any]) -> float:
+    def _assess_commercialization_team_strength(self, features: ProposalFeatures) -> float:
         """Assess team's capability for commercialization"""
-        staffing = proposal.get('staffing', {})
-        
-        # Calculate team composition scores
-        faculty = staffing.get('faculty', 0)
-        staff = staffing.get('staff', 0)
-        students = staffing.get('graduate_students', 0)
-        
-        # Ideal ratios for commercialization
-        total_team = faculty + staff + students
-        if total_team == 0:
-            return 0.5
-        
-        # Calculate scores based on team composition
-        faculty_ratio = faculty / total_team
-        staff_ratio = staff / total_team
-        student_ratio = students / total_team
-        
-        # Ideal ratios: 30% faculty, 40% staff, 30% students
-        composition_score = 1.0 - (
-            abs(faculty_ratio - 0.3) +
-            abs(staff_ratio - 0.4) +
-            abs(student_ratio - 0.3)
-        ) / 2
+        return research_scoring.commercialization_team_score(
+            features.faculty,
+            features.staff,
+            features.graduate_students
+        )
+
+    def _area_keyword_matches(self, areas_lower: Tuple[str, ...], keyword_table: Mapping[str, Any]) -> List[Tuple[int, Any]]:
+        """(area index, table entry) for each keyword at the first lowercased research area mentioning it"""
+        # Keywords that appear in no area are dropped with one search of the joined areas
+        areas_text = '\n'.join(areas_lower)
+        remaining = [(keyword, entry) for keyword, entry in keyword_table.items() if keyword in areas_text]
+        
+        # Each keyword is reported once, so it leaves the scan at its first match
+        matches = []
+        for index, area in enumerate(areas_lower):
+            if not remaining:
+                break
+            unmatched = []
+            for keyword, entry in remaining:
+                if keyword in area:
+                    matches.append((index, entry))
+                else:
+                    unmatched.append((keyword, entry))
+            remaining = unmatched
         
-        return max(min(composition_score, 1.0), 0.0) 
+        return matches
 
-    def _identify_industry_partners(self, proposal: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _identify_industry_partners(self, features: ProposalFeatures) -> List[Dict[str, Any]]:
         """Identify potential industry partnership opportunities"""
-        research_areas = proposal.get('research_areas', [])
-        funding_sources = proposal.get('funding_sources', {})
-        
-        # Industry sectors interested in AI ethics
-        industry_sectors = {
-            'ai': {
-                'sector': 'Tech Companies',
-                'interest_level': 0.9,
-                'potential_partners': ['Major Tech Firms', 'AI Startups'],
-                'collaboration_areas': ['AI Ethics Guidelines', 'Bias Detection']
-            },
-            'ethics': {
-                'sector': 'Consulting',
-                'interest_level': 0.8,
-                'potential_partners': ['Ethics Consultancies', 'Policy Think Tanks'],
-                'collaboration_areas': ['Policy Development', 'Ethics Training']
-            },
-            'security': {
-                'sector': 'Cybersecurity',
-                'interest_level': 0.85,
-                'potential_partners': ['Security Firms', 'Financial Institutions'],
-                'collaboration_areas': ['Security Protocols', 'Risk Assessment']
-            },
-            'privacy': {
-                'sector': 'Data Protection',
-                'interest_level': 0.85,
-                'potential_partners': ['Privacy Tech Companies', 'Legal Tech Firms'],
-                'collaboration_areas': ['Privacy Tools', 'Compliance Solutions']
-            }
-        }
+        funding_potential = features.industry_funding * INDUSTRY_FUNDING_AMOUNT
         
         # Identify relevant partnerships based on research areas
-        partnerships = []
-        for area in research_areas:
-            area_lower = area.lower()
-            for keyword, sector_info in industry_sectors.items():
-                if keyword in area_lower:
-                    partnership = sector_info.copy()
-                    partnership['relevance'] = sector_info['interest_level']
-                    partnership['funding_potential'] = funding_sources.get('industry', 0) * 1000000  # Convert to amount
-                    partnerships.append(partnership)
-        
-        return partnerships
-
-    def _identify_academic_collaborations(self, proposal: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [
+            {
+                **sector_info,
+                'relevance': sector_info['interest_level'],
+                'funding_potential': funding_potential
+            }
+            for _, sector_info in self._area_keyword_matches(features.research_areas_lower, INDUSTRY_SECTORS)
+        ]
+
+    def _identify_academic_collaborations(self, features: ProposalFeatures) -> List[Dict[str, Any]]:
         """Identify potential academic collaboration opportunities"""
-        research_areas = proposal.get('research_areas', [])
-        
-        # Academic disciplines relevant to AI ethics
-        academic_fields = {
-            'ai': ['Computer Science', 'Data Science', 'Robotics'],
-            'ethics': ['Philosophy', 'Law', 'Social Sciences'],
-            'policy': ['Public Policy', 'Government', 'International Relations'],
-            'security': ['Information Security', 'Risk Management'],
-            'privacy': ['Law', 'Information Systems', 'Digital Rights']
-        }
-        
-        collaborations = []
-        for area in research_areas:
-            area_lower = area.lower()
-            for keyword, fields in academic_fields.items():
-                if keyword in area_lower:
-                    collaborations.append({
-                        'field': fields,
-                        'research_area': area,
-                        'collaboration_type': 'Joint Research',
-                        'potential_impact': 0.8,
-                        'resource_sharing': True
-                    })
-        
-        return collaborations
-
-    def _evaluate_interdisciplinary_scope(self, proposal: Dict[str, Any]) -> float:
+        research_areas = features.research_areas
+        return [
+            {
+                'field': fields,
+                'research_area': research_areas[index],
+                'collaboration_type': 'Joint Research',
+                'potential_impact': 0.8,
+                'resource_sharing': True
+            }
+            for index, fields in self._area_keyword_matches(features.research_areas_lower, ACADEMIC_FIELDS)
+        ]
+
+    def _evaluate_interdisciplinary_scope(self, features: ProposalFeatures) -> float:
         """Evaluate potential for interdisciplinary research"""
-        research_areas = proposal.get('research_areas', [])
-        
-        # Define discipline categories
-        disciplines = {
-            'technical': ['ai', 'computing', 'technology', 'data'],
-            'social': ['ethics', 'policy', 'social', 'impact'],
-            'business': ['innovation', 'market', 'industry'],
-            'legal': ['compliance', 'regulation', 'privacy']
-        }
+        # Keywords never span a newline, so one search of the joined areas finds a match in any area
+        areas_text = '\n'.join(features.research_areas_lower)
         
         # Count unique discipline categories covered
-        covered_disciplines = set()
-        for area in research_areas:
-            area_lower = area.lower()
-            for category, keywords in disciplines.items():
-                if any(keyword in area_lower for keyword in keywords):
-                    covered_disciplines.add(category)
+        discipline_count = sum(
+            any(keyword in areas_text for keyword in keywords)
+            for keywords in DISCIPLINE_KEYWORDS.values()
+        )
         
         # Calculate interdisciplinary score
-        discipline_count = len(covered_disciplines)
-        base_score = min(discipline_count / len(disciplines), 1.0)
+        base_score = min(discipline_count / len(DISCIPLINE_KEYWORDS), 1.0)
         
         # Bonus for balanced coverage
-        balance_score = len(covered_disciplines) / len(disciplines)
+        balance_score = discipline_count / len(DISCIPLINE_KEYWORDS)
         
         return (base_score * 0.7 + balance_score * 0.3)
 
-    def _assess_network_growth(self, proposal: Dict[str, Any]) -> Dict[str, float]:
+    def _assess_network_growth(self, industry_partners: List[Dict[str, Any]],
+                               academic_collabs: List[Dict[str, Any]]) -> Dict[str, float]:
         """Assess potential for research network growth"""
-        industry_partners = self._identify_industry_partners(proposal)
-        academic_collabs = self._identify_academic_collaborations(proposal)
-        
         return {
             'industry_network': len(industry_partners) * 0.2,
             'academic_network': len(academic_collabs) * 0.15,
@@ -669,24 +695,20 @@ class ResearchInnovationAgent(BoardAgent):
 
     def _make_vote_decision(self, evaluation: Dict[str, Any]) -> Dict[str, Any]:
         """Make voting decision based on evaluation results"""
-        # Calculate weighted scores
-        weights = {
-            'research_potential': 0.3,
-            'innovation_impact': 0.3,
-            'collaboration_opportunities': 0.2,
-            'knowledge_transfer': 0.2
-        }
-        
+        # Average the plain-number scores of each aspect, then weight the averages
         scores = {}
-        for aspect, weight in weights.items():
+        total_score = 0
+        for aspect, weight in VOTE_WEIGHTS.items():
             if aspect in evaluation:
-                aspect_scores = [
-                    score for score in evaluation[aspect].values()
-                    if isinstance(score, (int, float))
-                ]
-                scores[aspect] = sum(aspect_scores) / len(aspect_scores) if aspect_scores else 0.5
-        
-        total_score = sum(score * weights[aspect] for aspect, score in scores.items())
+                aspect_total = 0
+                aspect_count = 0
+                for score in evaluation[aspect].values():
+                    if isinstance(score, (int, float)):
+                        aspect_total += score
+                        aspect_count += 1
+                score = aspect_total / aspect_count if aspect_count else 0.5
+                scores[aspect] = score
+                total_score += score * weight
         
         # Determine vote and rationale
         if total_score > 0.8:
@@ -762,8 +784,9 @@ class ResearchInnovationAgent(BoardAgent):
             
             # Add collaboration suggestions
             feedback.append("\nCollaboration Opportunities:")
-            industry_partners = self._identify_industry_partners(context.get('proposal', {}))
-            academic_collabs = self._identify_academic_collaborations(context.get('proposal', {}))
+            features = ProposalFeatures(context.get('proposal', {}))
+            industry_partners = self._identify_industry_partners(features)
+            academic_collabs = self._identify_academic_collaborations(features)
             
             if industry_partners:
                 feedback.append("- Potential industry partnerships identified:")
@@ -787,110 +810,40 @@ class ResearchInnovationAgent(BoardAgent):
             self.logger.error(f"Error generating structured feedback: {str(e)}")
             return "Error generating feedback. Please check the evaluation data."
 
-    def _evaluate_tech_transfer(self, proposal: Dict[str, Any]) -> float:
+    def _evaluate_tech_transfer(self, features: ProposalFeatures) -> float:
         """Evaluate technology transfer potential"""
-        research_areas = proposal.get('research_areas', [])
-        funding_sources = proposal.get('funding_sources', {})
-        
-        # Define tech transfer indicators
-        tech_transfer_potential = {
-            'ai': 0.9,
-            'technology': 0.85,
-            'application': 0.8,
-            'computing': 0.8,
-            'security': 0.75,
-            'innovation': 0.85
-        }
-        
         # Calculate base score from research areas
-        area_scores = []
-        for area in research_areas:
-            area_lower = area.lower()
-            matching_scores = [
-                score for keyword, score in tech_transfer_potential.items()
-                if keyword in area_lower
-            ]
-            if matching_scores:
-                area_scores.append(max(matching_scores))
+        area_scores = self._keyword_area_scores(features.research_areas_lower, TECH_TRANSFER_SCORES)
         
         base_score = sum(area_scores) / len(area_scores) if area_scores else 0.5
         
         # Industry funding indicates better tech transfer potential
-        industry_funding = funding_sources.get('industry', 0)
-        funding_score = min(industry_funding * 2, 1.0)
+        funding_score = self._industry_interest(features)
         
         # Weight the components
         return (base_score * 0.6 + funding_score * 0.4)
 
-    def _assess_industry_application(self, proposal: Dict[str, Any]) -> float:
+    def _assess_industry_application(self, features: ProposalFeatures) -> float:
         """Assess potential for industry application"""
-        research_areas = proposal.get('research_areas', [])
-        
-        # Define application-oriented keywords
-        application_keywords = {
-            'application': 1.0,
-            'industry': 0.9,
-            'practical': 0.8,
-            'implementation': 0.8,
-            'solution': 0.7
-        }
-        
         # Score based on application orientation
-        area_scores = []
-        for area in research_areas:
-            area_lower = area.lower()
-            matching_scores = [
-                score for keyword, score in application_keywords.items()
-                if keyword in area_lower
-            ]
-            if matching_scores:
-                area_scores.append(max(matching_scores))
+        area_scores = self._keyword_area_scores(features.research_areas_lower, INDUSTRY_APPLICATION_SCORES)
         
         return sum(area_scores) / len(area_scores) if area_scores else 0.5
 
-    def _evaluate_societal_impact(self, proposal: Dict[str, Any]) -> float:
+    def _evaluate_societal_impact(self, features: ProposalFeatures) -> float:
         """Evaluate potential societal impact"""
-        research_areas = proposal.get('research_areas', [])
-        
-        # Define societal impact indicators
-        impact_indicators = {
-            'ethics': 1.0,
-            'social': 0.9,
-            'policy': 0.8,
-            'public': 0.8,
-            'impact': 0.7
-        }
-        
         # Calculate impact score
-        area_scores = []
-        for area in research_areas:
-            area_lower = area.lower()
-            matching_scores = [
-                score for keyword, score in impact_indicators.items()
-                if keyword in area_lower
-            ]
-            if matching_scores:
-                area_scores.append(max(matching_scores))
+        area_scores = self._keyword_area_scores(features.research_areas_lower, SOCIETAL_IMPACT_SCORES)
         
         return sum(area_scores) / len(area_scores) if area_scores else 0.5
 
-    def _assess_educational_benefits(self, proposal: Dict[str, Any]) -> float:
+    def _assess_educational_benefits(self, features: ProposalFeatures) -> float:
         """Assess educational benefits of knowledge transfer"""
-        staffing = proposal.get('staffing', {})
-        
-        # Calculate educational impact factors
-        students = staffing.get('graduate_students', 0)
-        faculty = staffing.get('faculty', 0)
-        
-        # Score based on student involvement
-        student_ratio = students / (faculty + 1)  # Add 1 to avoid division by zero
-        student_score = min(student_ratio / 3, 1.0)  # Ideal ratio of 3 students per faculty
-        
-        # Consider research areas for educational value
-        research_areas = proposal.get('research_areas', [])
-        educational_score = min(len(research_areas) * 0.2, 1.0)
-        
-        return (student_score * 0.6 + educational_score * 0.4) 
+        return research_scoring.educational_benefit_score(
+            features.graduate_students,
+            features.faculty,
+            features.research_area_count
+        )
 
     def _calculate_impact_score(self, evaluation: Dict[str, Any]) -> float:
         """Calculate overall impact score"""
@@ -902,23 +855,12 @@ class ResearchInnovationAgent(BoardAgent):
             educational_score = knowledge_transfer.get('educational_benefits', 0.5)
             network_growth = evaluation.get('collaboration_opportunities', {}).get('network_expansion', {})
             
-            # Weight the different impact factors
-            weights = {
-                'collaboration': 0.3,
-                'societal': 0.3,
-                'educational': 0.2,
-                'network': 0.2
-            }
-            
-            # Calculate weighted score
-            impact_score = (
-                collaboration_score * weights['collaboration'] +
-                societal_score * weights['societal'] +
-                educational_score * weights['educational'] +
-                network_growth.get('growth_potential', 0.5) * weights['network']
+            return research_scoring.impact_score(
+                collaboration_score,
+                societal_score,
+                educational_score,
+                network_growth.get('growth_potential', 0.5)
             )
-            
-            return min(impact_score, 1.0)
         except Exception as e:
             self.logger.error(f"Error calculating impact score: {str(e)}")
             return 0.5 
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""Research and innovation scores for team make-up, facility readiness, educational benefit and impact"""
+
+
+def team_expertise_score(faculty: int, team_size: int) -> float:
+    """Faculty share of the team plus 0.3, capped at 1"""
+    if team_size == 0:
+        return 0.5
+
+    faculty_ratio = faculty / team_size
+    return min(faculty_ratio + 0.3, 1.0)  # Value faculty presence but cap the score
+
+
+def facility_readiness_score(lab_space: float, office_space: float, common_space: float) -> float:
+    """Closeness of the space split to 50% labs, 30% offices and 20% common areas"""
+    total_space = lab_space + office_space + common_space
+    if total_space == 0:
+        return 0.5
+
+    deviation = (
+        abs(lab_space / total_space - 0.5) +
+        abs(office_space / total_space - 0.3) +
+        abs(common_space / total_space - 0.2)
+    ) / 3
+    return 1.0 - deviation
+
+
+def commercialization_team_score(faculty: int, staff: int, graduate_students: int) -> float:
+    """Closeness of the team to 30% faculty, 40% staff and 30% students, clamped to 0-1"""
+    total_team = faculty + staff + graduate_students
+    if total_team == 0:
+        return 0.5
+
+    composition_score = 1.0 - (
+        abs(faculty / total_team - 0.3) +
+        abs(staff / total_team - 0.4) +
+        abs(graduate_students / total_team - 0.3)
+    ) / 2
+    return max(min(composition_score, 1.0), 0.0)
+
+
+def educational_benefit_score(graduate_students: int, faculty: int, research_area_count: int) -> float:
+    """Weighted student involvement (ideally three per faculty member) and research breadth"""
+    student_ratio = graduate_students / (faculty + 1)  # Add 1 to avoid division by zero
+    student_score = min(student_ratio / 3, 1.0)
+    educational_score = min(research_area_count * 0.2, 1.0)
+    return student_score * 0.6 + educational_score * 0.4
+
+
+def impact_score(collaboration: float, societal: float, educational: float, network_growth: float) -> float:
+    """Weighted interdisciplinary, societal, educational and network impact, capped at 1"""
+    return min(
+        collaboration * 0.3 +
+        societal * 0.3 +
+        educational * 0.2 +
+        network_growth * 0.2,
+        1.0
+    )
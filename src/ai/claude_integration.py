@@ -1,8 +1,49 @@
-from typing import Dict, List, Any
+from typing import Any, AsyncIterator, Dict, List, Tuple
+import asyncio
+import json
+import textwrap
 import anthropic
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 from src.utils.logging import setup_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Failures worth retrying: rate limits, timeouts, dropped connections and server errors
+TRANSIENT_ERRORS = (
+    anthropic.RateLimitError,
+    anthropic.APIConnectionError,
+    anthropic.InternalServerError
+)
+
+_backoff = wait_random_exponential(multiplier=1, min=1, max=10)
+
+def _retry_wait(retry_state) -> float:
+    """Honor the provider's Retry-After header, otherwise back off exponentially with jitter"""
+    response = getattr(retry_state.outcome.exception(), 'response', None)
+    retry_after = response.headers.get('retry-after') if response is not None else None
+    try:
+        return min(float(retry_after), 60.0)
+    except (TypeError, ValueError):
+        return _backoff(retry_state)
+
+SYSTEM_PROMPT = textwrap.dedent("""\
+    You are a {role} on the university's board of directors. Evaluate proposals and take part in
+    board discussions from your role's perspective and expertise.
+    Keep that perspective while being constructive in feedback, clear in reasoning, open to
+    compromise and focused on institutional benefit.
+    """)
+
+DISCUSSION_CONTEXT = textwrap.dedent("""\
+
+    Current Discussion Context:
+    - Round: {round}
+    - Topic: {topic}
+    - Current Consensus Level: {consensus_score}
+    """)
+
 class ClaudeAI:
     def __init__(self, config: Dict[str, Any] = None):
         if config is None:
@@ -13,74 +54,160 @@ class ClaudeAI:
         self.model = "claude-3-5-sonnet-20241022"  # Hardcoded correct model
         self.context_window = 200000
         
-        # Initialize async client
+        # Light extraction work goes to a smaller model; the others use the main model
+        self.tier_models = {
+            'fast': config.get('fast_model_name', 'claude-3-5-haiku-20241022'),
+            'balanced': self.model,
+            'strong': self.model
+        }
+        
+        # Initialize async client; retries are handled by generate_response
         self.client = anthropic.AsyncAnthropic(
-            api_key=config['anthropic_api_key']
+            api_key=config['anthropic_api_key'],
+            max_retries=0
         )
         
+        # Cap in-flight requests so concurrent agents stay within provider rate limits.
+        # The semaphore is created lazily so it binds to the loop that runs the requests.
+        self.max_concurrent_requests = config.get('max_concurrent_requests', 8)
+        self._request_slots = None
+        
         self.logger = setup_logger(f"{__name__}.ClaudeAI")
         self.logger.info("Initializing Claude AI integration...")
 
     @retry(
+        retry=retry_if_exception_type(TRANSIENT_ERRORS),
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
+        wait=_retry_wait,
+        reraise=True
     )
     async def generate_response(self, 
                               prompt: str, 
                               role: str, 
-                              context: Dict[str, Any]) -> Dict[str, Any]:
+                              context: Dict[str, Any],
+                              tier: str = 'balanced') -> Dict[str, Any]:
         """Generate AI response using Claude"""
         try:
             # Create system message
             system_prompt = self._construct_system_prompt(role, context)
+            model, temperature = self._model_settings(tier)
             
             # Create the message
-            message = await self.client.messages.create(
-                model=self.model,
-                max_tokens=self.config.get('max_tokens', 2000),
-                temperature=self.config.get('temperature', 0.5),
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
-            )
+            async with self._get_request_slots():
+                message = await self.client.messages.create(
+                    model=model,
+                    max_tokens=self.config.get('max_tokens', 2000),
+                    temperature=temperature,
+                    system=system_prompt,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ]
+                )
             
             return {
                 'content': message.content[0].text,
                 'role': "assistant",
-                'model': self.model,
+                'model': model,
                 'stop_reason': message.stop_reason if hasattr(message, 'stop_reason') else None,
                 'usage': message.usage if hasattr(message, 'usage') else None
             }
             
         except Exception as e:
             self.logger.error(f"Error calling Anthropic API: {str(e)}")
-            raise  # Re-raise to trigger retry
+            raise  # Transient errors are retried, the rest propagate
     
-    def _construct_system_prompt(self, role: str, context: Dict[str, Any]) -> str:
-        """Construct role-specific system prompt"""
-        base_prompt = f"""You are a {role} on the university's board of directors.
-        Your responsibility is to evaluate proposals and participate in board discussions
-        from your specific perspective and expertise.
+    async def generate_response_stream(self,
+                                       prompt: str,
+                                       role: str,
+                                       context: Dict[str, Any],
+                                       tier: str = 'balanced') -> AsyncIterator[str]:
+        """Stream the AI response text as it is generated"""
+        system_prompt = self._construct_system_prompt(role, context)
+        model, temperature = self._model_settings(tier)
         
-        Current Discussion Context:
-        - Round: {context.get('round', 1)}
-        - Topic: {context.get('topic', 'Not specified')}
-        - Current Consensus Level: {context.get('consensus_score', 'Not available')}
+        # Closing this generator (aclose) exits the stream, ending generation on the provider side
+        async with self._get_request_slots():
+            try:
+                async with self.client.messages.stream(
+                    model=model,
+                    max_tokens=self.config.get('max_tokens', 2000),
+                    temperature=temperature,
+                    system=system_prompt,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ]
+                ) as stream:
+                    async for text in stream.text_stream:
+                        yield text
+            except Exception as e:
+                self.logger.error(f"Error streaming from Anthropic API: {str(e)}")
+                raise
+    
+    def _model_settings(self, tier: str) -> Tuple[str, float]:
+        """Model and temperature for a request tier"""
+        # Extraction answers should be deterministic so repeated prompts match
+        temperature = 0.0 if tier == 'fast' else self.config.get('temperature', 0.5)
+        return self.tier_models.get(tier, self.model), temperature
+    
+    def _get_request_slots(self) -> asyncio.Semaphore:
+        """Semaphore limiting concurrent requests to the API"""
+        if self._request_slots is None:
+            self._request_slots = asyncio.Semaphore(self.max_concurrent_requests)
+        return self._request_slots
+    
+    async def generate_batch(self,
+                           prompts: Dict[str, str],
+                           role: str,
+                           context: Dict[str, Any],
+                           tier: str = 'balanced') -> Dict[str, str]:
+        """Answer several named prompts with a single Claude request"""
+        if not prompts:
+            return {}
+        
+        # A single prompt needs no combining or splitting
+        if len(prompts) == 1:
+            (name, prompt), = prompts.items()
+            response = await self.generate_response(prompt, role, context, tier)
+            return {name: response['content']}
+        
+        sections = "\n\n".join(
+            f"### {name}\n{prompt}" for name, prompt in prompts.items()
+        )
+        prompt = (
+            "Answer each of the following sections. Respond only with a JSON object "
+            f"whose keys are {json.dumps(list(prompts))} and whose values are your "
+            "answer to that section as a string.\n\n" + sections
+        )
         
-        Maintain your role's perspective while being:
-        1. Constructive in feedback
-        2. Clear in reasoning
-        3. Open to compromise
-        4. Focused on institutional benefit
-        """
+        response = await self.generate_response(prompt, role, context, tier)
+        return self._parse_batch_response(response['content'], prompts)
+    
+    def _parse_batch_response(self, content: str, prompts: Dict[str, str]) -> Dict[str, str]:
+        """Split a combined JSON answer back into per-section responses"""
+        try:
+            payload = content[content.index('{'):content.rindex('}') + 1]
+            answers = orjson.loads(payload) if orjson else json.loads(payload)
+            return {name: str(answers.get(name, '')) for name in prompts}
+        except (ValueError, AttributeError) as e:
+            # Keep the raw answer for every section rather than losing it
+            self.logger.warning(f"Could not split batched response: {str(e)}")
+            return {name: content for name in prompts}
+    
+    def _construct_system_prompt(self, role: str, context: Dict[str, Any]) -> str:
+        """Construct role-specific system prompt"""
+        # Role framing comes first so identical prefixes repeat across calls
+        base_prompt = SYSTEM_PROMPT.format(role=role)
         
         # Add role-specific guidelines
         role_guidelines = self.config['role_guidelines'].get(role, {})
         if role_guidelines:
-            base_prompt += f"\n\nRole-Specific Guidelines:\n{role_guidelines}"
+            base_prompt += f"\nRole-Specific Guidelines:\n{role_guidelines}\n"
         
-        return base_prompt
+        return base_prompt + DISCUSSION_CONTEXT.format(
+            round=context.get('round', 1),
+            topic=context.get('topic', 'Not specified'),
+            consensus_score=context.get('consensus_score', 'Not available')
+        )
     
     def _add_discussion_context(self, 
                               messages: List[Dict[str, Any]], 
@@ -107,7 +234,7 @@ class ClaudeAI:
                 'usage': response.usage
             }
         except AttributeError as e:
-            print(f"Error parsing response: {str(e)}")
+            self.logger.error("Error parsing response: %s", e)
             return {
                 'content': str(response),
                 'role': "assistant",
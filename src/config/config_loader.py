@@ -17,8 +17,16 @@ class ConfigLoader:
         base_config = {
             'anthropic_api_key': os.getenv('ANTHROPIC_API_KEY'),
             'model_name': os.getenv('MODEL_NAME', 'claude-3.5-sonnet'),
+            'fast_model_name': os.getenv('FAST_MODEL_NAME', 'claude-3-5-haiku-20241022'),
             'max_tokens': int(os.getenv('MAX_TOKENS', '2000')),
-            'temperature': float(os.getenv('TEMPERATURE', '0.5'))
+            'temperature': float(os.getenv('TEMPERATURE', '0.5')),
+            'max_concurrent_requests': int(os.getenv('MAX_CONCURRENT_REQUESTS', '8')),
+            # Seconds a round waits for every agent's call before giving up
+            'agent_call_timeout': float(os.getenv('AGENT_CALL_TIMEOUT', '300')),
+            # Optional JSON Lines file that keeps every recorded discussion
+            'discussion_log_path': os.getenv('DISCUSSION_LOG_PATH'),
+            # Agents score proposals locally; written AI analysis of each assessment is opt-in
+            'use_llm_assessments': os.getenv('USE_LLM_ASSESSMENTS', 'false').lower() in ('1', 'true', 'yes')
         }
         
         # Load role guidelines
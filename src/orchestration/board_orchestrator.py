@@ -1,4 +1,5 @@
-from typing import Dict, List, Any
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Tuple
 from src.agents.base import BoardAgent
 from src.agents.consensus_coordinator import ConsensusCoordinatorAgent
 from src.agents.documentation import DocumentationAgent
@@ -7,6 +8,7 @@ from src.agents.research_innovation import ResearchInnovationAgent
 from src.agents.infrastructure import InfrastructureAgent
 from src.agents.financial import FinancialAgent
 from src.agents.academic_affairs import AcademicAffairsAgent
+from src.ai.claude_integration import ClaudeAI
 from src.utils.logging import setup_logger
 
 class BoardOrchestrator:
@@ -17,16 +19,19 @@ class BoardOrchestrator:
         # Load configuration
         self.config = ConfigLoader().get_ai_config()
         
+        # Share one AI client so every agent reuses the same HTTP connection pool
+        self.ai = ClaudeAI(self.config)
+        
         # Initialize all agents
         self.logger.debug("Creating board agents...")
         self.agents = [
-            AcademicAffairsAgent(self.config),
-            FinancialAgent(self.config),
-            ResearchInnovationAgent(self.config),
-            InfrastructureAgent(self.config)
+            AcademicAffairsAgent(self.config, ai=self.ai),
+            FinancialAgent(self.config, ai=self.ai),
+            ResearchInnovationAgent(self.config, ai=self.ai),
+            InfrastructureAgent(self.config, ai=self.ai)
         ]
-        self.consensus_coordinator = ConsensusCoordinatorAgent(self.config)
-        self.documentation_agent = DocumentationAgent(self.config)
+        self.consensus_coordinator = ConsensusCoordinatorAgent(self.config, ai=self.ai)
+        self.documentation_agent = DocumentationAgent(self.config, ai=self.ai)
         self.logger.info("All agents initialized successfully")
         
     async def initiate_discussion(self, proposal: Dict[str, Any]) -> Dict[str, Any]:
@@ -42,15 +47,15 @@ class BoardOrchestrator:
         
         # Get initial evaluations from all agents
         self.logger.info("\n--- Initial Evaluation Round ---")
-        evaluations = []
-        for agent in self.agents:
-            self.logger.info(f"\n{agent.role} is evaluating the proposal...")
-            evaluation = await agent.evaluate_proposal(proposal)
+        evaluations = [None] * len(self.agents)
+        async for index, agent, evaluation in self._stream_agent_calls(
+            "evaluating the proposal", lambda agent: agent.evaluate_proposal(proposal)
+        ):
             self.logger.info(f"{agent.role}'s recommendation: {evaluation.get('overall_recommendation', 'No recommendation')}")
-            evaluations.append({
+            evaluations[index] = {
                 'agent_role': agent.role,
                 'evaluation': evaluation
-            })
+            }
         
         # Get consensus analysis
         self.logger.info("\n--- Consensus Analysis ---")
@@ -60,18 +65,19 @@ class BoardOrchestrator:
         # If no consensus, get agent feedback
         if consensus_analysis['consensus_score'] < self.config['consensus_threshold']:
             self.logger.info("\n--- Feedback Round ---")
-            feedback_round = []
-            for agent in self.agents:
-                self.logger.info(f"\n{agent.role} is providing feedback...")
-                feedback = await agent.generate_feedback({
-                    'evaluations': evaluations,
-                    'consensus_analysis': consensus_analysis
-                })
+            feedback_context = {
+                'evaluations': evaluations,
+                'consensus_analysis': consensus_analysis
+            }
+            feedback_round = [None] * len(self.agents)
+            async for index, agent, feedback in self._stream_agent_calls(
+                "providing feedback", lambda agent: agent.generate_feedback(feedback_context)
+            ):
                 self.logger.info(f"{agent.role}'s feedback length: {len(str(feedback))} chars")
-                feedback_round.append({
+                feedback_round[index] = {
                     'agent_role': agent.role,
                     'feedback': feedback
-                })
+                }
             
             # Update consensus analysis with feedback
             self.logger.info("\n--- Updated Consensus Analysis ---")
@@ -82,19 +88,11 @@ class BoardOrchestrator:
         
         # Final voting round
         self.logger.info("\n--- Final Voting Round ---")
-        votes = []
-        for agent in self.agents:
-            self.logger.info(f"\n{agent.role} is voting...")
-            vote = await agent.vote({
-                'proposal': proposal,
-                'evaluations': evaluations,
-                'consensus_analysis': consensus_analysis
-            })
-            self.logger.info(f"{agent.role}'s vote: {vote.get('vote', 'No vote')} - {vote.get('rationale', 'No rationale')[:100]}...")
-            votes.append({
-                'agent_role': agent.role,
-                'vote': vote
-            })
+        votes = await self._collect_votes({
+            'proposal': proposal,
+            'evaluations': evaluations,
+            'consensus_analysis': consensus_analysis
+        })
         
         # Document the discussion
         self.logger.info("\n--- Documenting Discussion ---")
@@ -124,6 +122,50 @@ class BoardOrchestrator:
             'documentation': documentation
         } 
 
+    async def _stream_agent_calls(self, action: str, call) -> AsyncIterator[Tuple[int, BoardAgent, Any]]:
+        """Run one call per agent concurrently and yield (seat, agent, result) as each completes"""
+        async def run(index: int, agent: BoardAgent) -> Tuple[int, BoardAgent, Any]:
+            self.logger.info(f"\n{agent.role} is {action}...")
+            return index, agent, await call(agent)
+        
+        tasks = [asyncio.create_task(run(index, agent)) for index, agent in enumerate(self.agents)]
+        try:
+            # A stalled call fails the round after the timeout instead of blocking it forever
+            for next_result in asyncio.as_completed(tasks, timeout=self.config.get('agent_call_timeout')):
+                yield await next_result
+        finally:
+            # After a failure or timeout, stop the calls still running so they release their request slots
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _collect_votes(self, ballot: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Collect agent votes as they arrive, tallying until a majority is reached"""
+        majority = len(self.agents) // 2 + 1
+        tally = {'support': 0, 'oppose': 0, 'abstain': 0}
+        decided = False
+        received = 0
+        votes = [None] * len(self.agents)
+        
+        async for index, agent, vote in self._stream_agent_calls("voting", lambda agent: agent.vote(ballot)):
+            self.logger.info(f"{agent.role}'s vote: {vote.get('vote', 'No vote')} - {vote.get('rationale', 'No rationale')[:100]}...")
+            votes[index] = {
+                'agent_role': agent.role,
+                'vote': vote
+            }
+            received += 1
+            
+            vote_type = vote.get('vote')
+            if vote_type in tally:
+                tally[vote_type] += 1
+                if not decided and tally[vote_type] >= majority:
+                    decided = True
+                    self.logger.info(
+                        f"Majority reached for '{vote_type}' with {received} of {len(self.agents)} votes in"
+                    )
+        
+        return votes
+
     def _analyze_votes(self, votes: List[Dict[str, Any]]) -> Dict[str, int]:
         """Analyze voting results"""
         vote_counts = {'support': 0, 'oppose': 0, 'abstain': 0}
@@ -0,0 +1,17 @@
+import asyncio
+import sys
+
+
+def install_uvloop() -> bool:
+    """Switch asyncio to uvloop's event loop policy when it is available"""
+    if sys.platform == "win32":
+        return False
+
+    try:
+        import uvloop
+    except ImportError:
+        # Fall back to the default asyncio loop
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
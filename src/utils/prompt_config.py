@@ -0,0 +1,76 @@
+import json
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml C bindings when PyYAML was built with them
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def _json_cache_path(file_path: str) -> str:
+    """JSON sidecar used as a parsed copy of a YAML prompt file"""
+    return os.path.splitext(file_path)[0] + '.json'
+
+
+def _read_json_cache(cache_path: str, source_mtime: float) -> Any:
+    """Return the cached config if the sidecar is at least as new as its source"""
+    try:
+        if os.path.getmtime(cache_path) < source_mtime:
+            return None
+        with open(cache_path, 'rb') as file:
+            data = file.read()
+        return orjson.loads(data) if orjson else json.loads(data)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json_cache(cache_path: str, config: Dict[str, Any]) -> None:
+    """Best-effort write of the JSON sidecar; the YAML stays the source of truth"""
+    try:
+        data = orjson.dumps(config) if orjson else json.dumps(config).encode('utf-8')
+        with open(cache_path, 'wb') as file:
+            file.write(data)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+@lru_cache(maxsize=None)
+def load_role_config(file_path: str) -> Mapping[str, Any]:
+    """Load a role's prompt config once and share a read-only view of it"""
+    cache_path = _json_cache_path(file_path)
+    config = _read_json_cache(cache_path, os.path.getmtime(file_path))
+
+    if config is None:
+        with open(file_path, 'r') as file:
+            config = yaml.load(file, Loader=_SafeLoader)
+        _write_json_cache(cache_path, config)
+
+    return MappingProxyType(config)
+
+
+def bake_role_configs(prompts_dir: str = 'src/prompts') -> List[str]:
+    """Write the JSON cache for every YAML prompt file ahead of time, returning the files written"""
+    baked = []
+    for filename in sorted(os.listdir(prompts_dir)):
+        if not filename.endswith('.yaml'):
+            continue
+        file_path = os.path.join(prompts_dir, filename)
+        with open(file_path, 'r') as file:
+            config = yaml.load(file, Loader=_SafeLoader)
+        cache_path = _json_cache_path(file_path)
+        _write_json_cache(cache_path, config)
+        if os.path.exists(cache_path):
+            baked.append(cache_path)
+    return baked
+
+
+if __name__ == '__main__':
+    for cache_path in bake_role_configs():
+        print(cache_path)
@@ -0,0 +1,66 @@
+from _string import formatter_field_name_split
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Callable, Dict
+
+PromptRenderer = Callable[[Dict[str, Any]], str]
+
+_CONVERSIONS = {'r': 'repr', 's': 'str', 'a': 'ascii'}
+
+
+def _fallback_renderer(template: str) -> PromptRenderer:
+    """Render with str.format for templates the compiler does not handle"""
+    return lambda fields: template.format(**fields)
+
+
+@lru_cache(maxsize=None)
+def compile_template(template: str) -> PromptRenderer:
+    """Compile a str.format template into a function of a fields dict
+
+    The template is parsed once and turned into a generated function that
+    joins its literal text with the formatted field values, so rendering
+    skips re-parsing the format string. Output and errors match
+    template.format(**fields); positional fields and nested format specs
+    fall back to str.format.
+    """
+    constants = {}
+    parts = []
+
+    def constant(value: Any) -> str:
+        name = f"_c{len(constants)}"
+        constants[name] = value
+        return name
+
+    try:
+        for literal, field_name, spec, conversion in Formatter().parse(template):
+            if literal:
+                parts.append(constant(literal))
+            if field_name is None:
+                continue
+            if '{' in spec:
+                return _fallback_renderer(template)
+
+            first, rest = formatter_field_name_split(field_name)
+            if not isinstance(first, str) or not first:
+                return _fallback_renderer(template)
+
+            expression = f"fields[{constant(first)}]"
+            for is_attribute, key in rest:
+                if is_attribute:
+                    expression = f"getattr({expression}, {constant(key)})"
+                else:
+                    expression = f"{expression}[{constant(key)}]"
+            if conversion:
+                expression = f"{_CONVERSIONS[conversion]}({expression})"
+            parts.append(f"format({expression}, {constant(spec)})")
+    except (ValueError, KeyError):
+        # Malformed templates raise the usual error when rendered
+        return _fallback_renderer(template)
+
+    if not parts:
+        return lambda fields: ''
+
+    source = f"def render(fields):\n    return ''.join(({', '.join(parts)},))\n"
+    namespace = dict(constants)
+    exec(compile(source, '<prompt template>', 'exec'), namespace)
+    return namespace['render']
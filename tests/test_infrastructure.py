@@ -0,0 +1,71 @@
+import copy
+
+import pytest
+
+from src.agents import infrastructure_scoring
+from src.agents.infrastructure import InfrastructureAgent
+
+SAMPLE_PROPOSAL = {
+    'title': 'New AI Ethics Research Center',
+    'department': 'Computer Science',
+    'budget': 5000000,
+    'timeline': '3 years',
+    'space_requirements': {'research_labs': 2000, 'offices': 2000, 'common_areas': 1000},
+    'staffing': {'faculty': 10, 'staff': 5, 'graduate_students': 15},
+    'research_areas': ['AI Ethics', 'Policy Research', 'Algorithmic Bias', 'Privacy and Security']
+}
+
+def make_agent():
+    # Scoring is local, so no AI client is needed
+    return InfrastructureAgent({'anthropic_api_key': 'test'}, ai=object())
+
+def scaled_proposal(total_space):
+    """The sample proposal with its space split kept but scaled to total_space sq ft"""
+    proposal = copy.deepcopy(SAMPLE_PROPOSAL)
+    proposal['space_requirements'] = {
+        'research_labs': total_space * 0.4,
+        'offices': total_space * 0.4,
+        'common_areas': total_space * 0.2
+    }
+    return proposal
+
+def test_sample_proposal_recommendation():
+    evaluation = make_agent()._evaluate_proposal(SAMPLE_PROPOSAL)
+
+    assert 0 <= evaluation['sustainability_impact']['sustainability_score'] <= 1
+    assert evaluation['overall_recommendation'] == "Support with Minor Modifications"
+
+def test_sustainability_falls_with_space():
+    agent = make_agent()
+    scores = [
+        agent._evaluate_proposal(scaled_proposal(total_space))['sustainability_impact']['sustainability_score']
+        for total_space in (1000, 5000, 20000, 50000)
+    ]
+
+    assert all(0 < score < 1 for score in scores)
+    assert scores == sorted(scores, reverse=True) and len(set(scores)) == len(scores)
+
+@pytest.mark.parametrize('total_space, recommendation', [
+    (5000, "Support with Minor Modifications"),
+    (20000, "Support with Minor Modifications"),
+    (100000, "Support with Major Modifications")
+])
+def test_recommendation_by_space(total_space, recommendation):
+    evaluation = make_agent()._evaluate_proposal(scaled_proposal(total_space))
+
+    assert evaluation['overall_recommendation'] == recommendation
+
+@pytest.mark.parametrize('total_score, recommendation', [
+    (0.39, "Cannot Support - Infrastructure Constraints"),
+    (0.41, "Support with Major Modifications"),
+    (0.6, "Support with Major Modifications"),
+    (0.61, "Support with Minor Modifications"),
+    (0.79, "Support with Minor Modifications"),
+    (0.81, "Strongly Support")
+])
+def test_recommendation_thresholds(monkeypatch, total_score, recommendation):
+    agent = make_agent()
+    evaluation = agent._evaluate_proposal(SAMPLE_PROPOSAL)
+    monkeypatch.setattr(infrastructure_scoring, 'recommendation_score', lambda *scores: total_score)
+
+    assert agent._generate_recommendation(evaluation) == recommendation